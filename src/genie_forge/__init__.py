@@ -48,23 +48,28 @@ class SensitiveDataFilter(logging.Filter):
         (re.compile(r"(secret[:\s=]+)['\"]?([^\s'\"]+)['\"]?", re.IGNORECASE), r"\1****"),
     ]
 
+    # Every pattern above starts with one of these keywords; text without any of
+    # them is left alone after a single scan
+    SENSITIVE_KEYWORDS = re.compile(r"dapi|token|bearer|password|secret", re.IGNORECASE)
+
+    def _mask(self, text: str) -> str:
+        """Apply every sensitive pattern to text that may contain credentials."""
+        if not self.SENSITIVE_KEYWORDS.search(text):
+            return text
+        for pattern, replacement in self.SENSITIVE_PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Mask sensitive data in the log record message."""
         if record.msg:
-            msg = str(record.msg)
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                msg = pattern.sub(replacement, msg)
-            record.msg = msg
+            record.msg = self._mask(str(record.msg))
 
         # Also mask args if present
         if record.args:
-            masked_args = []
-            for arg in record.args:
-                if isinstance(arg, str):
-                    for pattern, replacement in self.SENSITIVE_PATTERNS:
-                        arg = pattern.sub(replacement, arg)
-                masked_args.append(arg)
-            record.args = tuple(masked_args)
+            record.args = tuple(
+                self._mask(arg) if isinstance(arg, str) else arg for arg in record.args
+            )
 
         return True  # Always allow the record through (after masking)
 
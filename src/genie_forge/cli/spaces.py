@@ -39,10 +39,11 @@ def _display_plan(plan: Plan) -> None:
         return
 
     # Count operations
-    creates = sum(1 for i in plan.items if i.action == PlanAction.CREATE)
-    updates = sum(1 for i in plan.items if i.action == PlanAction.UPDATE)
-    destroys = sum(1 for i in plan.items if i.action == PlanAction.DESTROY)
-    unchanged = sum(1 for i in plan.items if i.action == PlanAction.NO_CHANGE)
+    counts = plan.action_counts()
+    creates = counts[PlanAction.CREATE]
+    updates = counts[PlanAction.UPDATE]
+    destroys = counts[PlanAction.DESTROY]
+    unchanged = counts[PlanAction.NO_CHANGE]
 
     # Operation summary header
     console.print("[bold]OPERATION SUMMARY[/bold]")
@@ -19,6 +19,7 @@ from __future__ import annotations
 import fnmatch
 import json
 import logging
+import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -105,7 +106,11 @@ class GenieAPIError(Exception):
         self.response = response
 
 
-@dataclass
+# One SpaceResult is created per bulk item; drop the per-instance __dict__ where supported
+_RESULT_DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class SpaceResult:
     """Result of a space operation."""
 
@@ -301,6 +306,9 @@ class GenieClient:
         Raises:
             GenieAPIError: If the request fails
         """
+        # Always fetch at least the first page
+        max_pages = max(1, max_pages)
+
         try:
             all_spaces: list[dict[str, Any]] = []
             page_token: str | None = None
@@ -476,9 +484,10 @@ class GenieClient:
         """
         start = time.time()
         results: list[SpaceResult] = []
+        max_workers, rate_limit = self._normalize_bulk_params(max_workers, rate_limit)
 
         # Calculate delay between submissions for rate limiting
-        submission_delay = 1.0 / rate_limit if rate_limit and rate_limit > 0 else 0
+        submission_delay = 1.0 / rate_limit if rate_limit else 0
 
         def create_one(config: dict) -> SpaceResult:
             logical_id = config.get("space_id", config.get("title", "unknown"))
@@ -552,9 +561,10 @@ class GenieClient:
         """
         start = time.time()
         results: list[SpaceResult] = []
+        max_workers, rate_limit = self._normalize_bulk_params(max_workers, rate_limit)
 
         # Calculate delay between submissions for rate limiting
-        submission_delay = 1.0 / rate_limit if rate_limit and rate_limit > 0 else 0
+        submission_delay = 1.0 / rate_limit if rate_limit else 0
 
         def delete_one(space_id: str) -> SpaceResult:
             try:
@@ -599,6 +609,20 @@ class GenieClient:
     # Helper Methods
     # =========================================================================
 
+    @staticmethod
+    def _normalize_bulk_params(
+        max_workers: int, rate_limit: Optional[float]
+    ) -> tuple[int, Optional[float]]:
+        """Clamp bulk-operation knobs to values the executor can use.
+
+        A worker count below 1 is raised to 1, and a non-positive rate limit
+        means unlimited (None).
+        """
+        max_workers = max(1, int(max_workers or 1))
+        if rate_limit is not None and rate_limit <= 0:
+            rate_limit = None
+        return max_workers, rate_limit
+
     def _build_minimal_serialized_space(
         self,
         tables: list[str],
@@ -50,6 +50,14 @@ DEMO_FUNCTIONS_INFO = {
     },
 }
 
+# DROP statement templates, built once since only catalog/schema vary per call
+_TABLE_DROP_TEMPLATES = {
+    name: f"DROP TABLE IF EXISTS {{catalog}}.{{schema}}.{name};" for name in DEMO_TABLES_INFO
+}
+_FUNCTION_DROP_TEMPLATES = {
+    name: f"DROP FUNCTION IF EXISTS {{catalog}}.{{schema}}.{name};" for name in DEMO_FUNCTIONS_INFO
+}
+
 
 def create_demo_tables(
     client: Any,
@@ -666,7 +674,7 @@ def get_demo_objects_summary(catalog: str, schema: str) -> dict[str, Any]:
                 "type": "TABLE",
                 "rows": info["rows"],
                 "description": info["description"],
-                "drop_sql": f"DROP TABLE IF EXISTS {catalog}.{schema}.{name};",
+                "drop_sql": _TABLE_DROP_TEMPLATES[name].format(catalog=catalog, schema=schema),
             }
             for name, info in DEMO_TABLES_INFO.items()
         ],
@@ -676,7 +684,7 @@ def get_demo_objects_summary(catalog: str, schema: str) -> dict[str, Any]:
                 "name": name,
                 "type": "FUNCTION",
                 "description": info["description"],
-                "drop_sql": f"DROP FUNCTION IF EXISTS {catalog}.{schema}.{name};",
+                "drop_sql": _FUNCTION_DROP_TEMPLATES[name].format(catalog=catalog, schema=schema),
             }
             for name, info in DEMO_FUNCTIONS_INFO.items()
         ],
@@ -20,11 +20,41 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
+import unicodedata
+from collections import Counter
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional, Union
+from operator import attrgetter
+from typing import Any, Mapping, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Canonical encoder for config_hash(); must stay byte-compatible with stored hashes
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+_get_identifier = attrgetter("identifier")
+
+
+def _coerce_str_list(v: Any) -> list[str]:
+    """Wrap a bare string in a list; copy any other iterable into a list."""
+    if type(v) is list:
+        # Common case; pydantic builds its own list when validating the items
+        return v
+    if isinstance(v, str):
+        return [v]
+    return list(v)
+
+
+def _coerce_optional_str_list(v: Any) -> list[str]:
+    """Like _coerce_str_list, but None and "" become an empty list."""
+    if type(v) is list:
+        return v
+    if v is None:
+        return []
+    if isinstance(v, str):
+        return [v] if v else []
+    return list(v)
 
 
 def _utc_now() -> datetime:
@@ -42,12 +72,18 @@ class SpaceStatus(str, Enum):
     DESTROYED = "DESTROYED"
 
 
+class _LeafModel(BaseModel):
+    """Base for small leaf models that are never modified after construction."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 # =============================================================================
 # Column and Table Configuration
 # =============================================================================
 
 
-class ColumnConfig(BaseModel):
+class ColumnConfig(_LeafModel):
     """Configuration for a table column in Genie space.
 
     Matches the Genie API column_configs structure exactly.
@@ -73,15 +109,17 @@ class ColumnConfig(BaseModel):
         default=False, description="Get example values for this column"
     )
 
+    @field_validator("column_name")
+    @classmethod
+    def intern_column_name(cls, v: str) -> str:
+        """Intern column names; the same names repeat across many tables."""
+        return sys.intern(v)
+
     @field_validator("description", mode="before")
     @classmethod
     def normalize_description(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v] if v else []
-        return list(v)
+        return _coerce_optional_str_list(v)
 
 
 class TableConfig(BaseModel):
@@ -98,21 +136,16 @@ class TableConfig(BaseModel):
     @field_validator("identifier")
     @classmethod
     def validate_identifier(cls, v: str) -> str:
-        """Validate table identifier format."""
-        parts = v.split(".")
-        if len(parts) != 3:
+        """Validate table identifier format (interned, as it is used as a lookup key)."""
+        if v.count(".") != 2:
             raise ValueError(f"Table identifier must be in format 'catalog.schema.table', got: {v}")
-        return v
+        return sys.intern(v)
 
     @field_validator("description", mode="before")
     @classmethod
     def normalize_description(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v] if v else []
-        return list(v)
+        return _coerce_optional_str_list(v)
 
 
 # =============================================================================
@@ -120,7 +153,7 @@ class TableConfig(BaseModel):
 # =============================================================================
 
 
-class SampleQuestion(BaseModel):
+class SampleQuestion(_LeafModel):
     """A sample question shown in the Genie UI.
 
     Matches the Genie API sample_questions structure.
@@ -132,10 +165,13 @@ class SampleQuestion(BaseModel):
     @field_validator("question", mode="before")
     @classmethod
     def normalize_question(cls, v: Any) -> list[str]:
-        """Accept both string and list formats for backward compatibility."""
+        """Accept both string and list formats for backward compatibility.
+
+        Question text is NFC-normalized so equivalent spellings compare equal.
+        """
         if isinstance(v, str):
-            return [v]
-        return list(v)
+            v = [v]
+        return [unicodedata.normalize("NFC", q) if isinstance(q, str) else q for q in v]
 
 
 # =============================================================================
@@ -143,7 +179,7 @@ class SampleQuestion(BaseModel):
 # =============================================================================
 
 
-class TextInstruction(BaseModel):
+class TextInstruction(_LeafModel):
     """A text instruction for Genie.
 
     Matches the Genie API text_instructions structure.
@@ -156,9 +192,7 @@ class TextInstruction(BaseModel):
     @classmethod
     def normalize_content(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if isinstance(v, str):
-            return [v]
-        return list(v)
+        return _coerce_str_list(v)
 
 
 # =============================================================================
@@ -166,7 +200,7 @@ class TextInstruction(BaseModel):
 # =============================================================================
 
 
-class ParameterDefaultValue(BaseModel):
+class ParameterDefaultValue(_LeafModel):
     """Default value for a parameter in example SQL."""
 
     values: list[str] = Field(default_factory=list, description="Default value(s)")
@@ -185,15 +219,17 @@ class ParameterConfig(BaseModel):
         None, description="Default value configuration"
     )
 
+    @field_validator("name", "type_hint")
+    @classmethod
+    def intern_name(cls, v: str) -> str:
+        """Intern names and type hints; the same values repeat across example SQLs."""
+        return sys.intern(v)
+
     @field_validator("description", mode="before")
     @classmethod
     def normalize_description(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v] if v else []
-        return list(v)
+        return _coerce_optional_str_list(v)
 
 
 class ExampleQuestionSQL(BaseModel):
@@ -217,27 +253,19 @@ class ExampleQuestionSQL(BaseModel):
     @classmethod
     def normalize_question(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if isinstance(v, str):
-            return [v]
-        return list(v)
+        return _coerce_str_list(v)
 
     @field_validator("sql", mode="before")
     @classmethod
     def normalize_sql(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if isinstance(v, str):
-            return [v]
-        return list(v)
+        return _coerce_str_list(v)
 
     @field_validator("usage_guidance", mode="before")
     @classmethod
     def normalize_usage_guidance(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v] if v else []
-        return list(v)
+        return _coerce_optional_str_list(v)
 
 
 # =============================================================================
@@ -260,7 +288,7 @@ class SqlFunction(BaseModel):
 # =============================================================================
 
 
-class JoinTableRef(BaseModel):
+class JoinTableRef(_LeafModel):
     """Reference to a table in a join specification.
 
     Matches the Genie API join_specs left/right structure.
@@ -269,6 +297,12 @@ class JoinTableRef(BaseModel):
     identifier: str = Field(..., description="Full table path: catalog.schema.table")
     alias: Optional[str] = Field(None, description="Alias for the table in the join")
 
+    @field_validator("identifier", "alias")
+    @classmethod
+    def intern_identifier(cls, v: Optional[str]) -> Optional[str]:
+        """Intern join table names; each table usually appears in several joins."""
+        return sys.intern(v) if v is not None else v
+
 
 class JoinSpec(BaseModel):
     """Specification for how tables should be joined.
@@ -290,19 +324,13 @@ class JoinSpec(BaseModel):
     @classmethod
     def normalize_sql(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if isinstance(v, str):
-            return [v]
-        return list(v)
+        return _coerce_str_list(v)
 
     @field_validator("instruction", mode="before")
     @classmethod
     def normalize_instruction(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v] if v else []
-        return list(v)
+        return _coerce_optional_str_list(v)
 
 
 # =============================================================================
@@ -310,7 +338,7 @@ class JoinSpec(BaseModel):
 # =============================================================================
 
 
-class SqlSnippet(BaseModel):
+class SqlSnippet(_LeafModel):
     """A SQL snippet (filter, expression, or measure).
 
     Matches the Genie API sql_snippets structure for filters, expressions, and measures.
@@ -330,19 +358,13 @@ class SqlSnippet(BaseModel):
     @classmethod
     def normalize_sql(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if isinstance(v, str):
-            return [v]
-        return list(v)
+        return _coerce_str_list(v)
 
     @field_validator("instruction", mode="before")
     @classmethod
     def normalize_instruction(cls, v: Any) -> list[str]:
         """Accept both string and list formats for backward compatibility."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return [v] if v else []
-        return list(v)
+        return _coerce_optional_str_list(v)
 
 
 class SqlSnippets(BaseModel):
@@ -463,6 +485,20 @@ class SpaceConfig(BaseModel):
     description: Optional[str] = Field(None, description="Description of this space")
     tags: list[str] = Field(default_factory=list, description="Tags for organizing spaces")
 
+    @field_validator("warehouse_id")
+    @classmethod
+    def intern_warehouse_id(cls, v: str) -> str:
+        """Intern warehouse IDs; most spaces in a project share one or two."""
+        return sys.intern(v)
+
+    @field_validator("title", mode="before")
+    @classmethod
+    def normalize_title(cls, v: Any) -> Any:
+        """NFC-normalize the title so equivalent spellings hash identically."""
+        if isinstance(v, str):
+            return unicodedata.normalize("NFC", v)
+        return v
+
     @field_validator("sample_questions", mode="before")
     @classmethod
     def normalize_sample_questions(cls, v: Any) -> list[Union[SampleQuestion, str]]:
@@ -473,7 +509,7 @@ class SpaceConfig(BaseModel):
         for item in v:
             if isinstance(item, str):
                 # Keep as string for backward compatibility - will be converted during serialization
-                result.append(item)
+                result.append(unicodedata.normalize("NFC", item))
             elif isinstance(item, dict):
                 result.append(SampleQuestion(**item))
             elif isinstance(item, SampleQuestion):
@@ -484,13 +520,10 @@ class SpaceConfig(BaseModel):
 
     def get_sample_questions_as_objects(self) -> list[SampleQuestion]:
         """Get sample questions as SampleQuestion objects."""
-        result = []
-        for item in self.sample_questions:
-            if isinstance(item, str):
-                result.append(SampleQuestion(question=[item]))
-            else:
-                result.append(item)
-        return result
+        return [
+            SampleQuestion(question=[item]) if isinstance(item, str) else item
+            for item in self.sample_questions
+        ]
 
     def config_hash(self) -> str:
         """Generate a hash of the configuration for change detection.
@@ -499,16 +532,28 @@ class SpaceConfig(BaseModel):
         """
         # Create a sorted, normalized representation
         data = self.model_dump(exclude={"space_id"}, exclude_none=True)
-        normalized = json.dumps(data, sort_keys=True, default=str)
+        normalized = _HASH_ENCODER.encode(data)
         return hashlib.sha256(normalized.encode()).hexdigest()
 
+    @classmethod
+    def missing_required(cls, data: Mapping[str, Any]) -> list[str]:
+        """List required fields absent from raw config data, in field order.
+
+        A cheap structural pre-check that avoids building a ValidationError.
+        """
+        return [
+            name
+            for name, field in cls.model_fields.items()
+            if field.is_required() and name not in data
+        ]
+
     def get_table_identifiers(self) -> list[str]:
         """Get list of all table identifiers."""
-        return [t.identifier for t in self.data_sources.tables]
+        return list(map(_get_identifier, self.data_sources.tables))
 
     def get_function_identifiers(self) -> list[str]:
         """Get list of all function identifiers."""
-        return [f.identifier for f in self.instructions.sql_functions]
+        return list(map(_get_identifier, self.instructions.sql_functions))
 
     @classmethod
     def minimal(
@@ -636,11 +681,18 @@ class Plan(BaseModel):
     @property
     def has_changes(self) -> bool:
         """Whether the plan has any changes."""
-        return len(self.creates) > 0 or len(self.updates) > 0 or len(self.destroys) > 0
+        return any(i.action != PlanAction.NO_CHANGE for i in self.items)
+
+    def action_counts(self) -> Counter[PlanAction]:
+        """Count items per action in a single pass over the plan."""
+        return Counter(i.action for i in self.items)
 
     def summary(self) -> str:
         """Get a summary of the plan."""
+        counts = self.action_counts()
         return (
-            f"Plan: {len(self.creates)} to create, {len(self.updates)} to update, "
-            f"{len(self.destroys)} to destroy, {len(self.no_changes)} unchanged"
+            f"Plan: {counts[PlanAction.CREATE]} to create, "
+            f"{counts[PlanAction.UPDATE]} to update, "
+            f"{counts[PlanAction.DESTROY]} to destroy, "
+            f"{counts[PlanAction.NO_CHANGE]} unchanged"
         )
@@ -19,7 +19,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, Iterable, Literal, Optional, Union
 
 import yaml
 
@@ -45,6 +45,39 @@ from genie_forge.models import (
 
 logger = logging.getLogger(__name__)
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it; both are "safe"
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
+# orjson is optional; when present it parses JSON configs natively
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+# Config formats recognised from file suffixes; other suffixes try YAML, then JSON
+_FORMAT_BY_SUFFIX = {".yaml": "yaml", ".yml": "yaml", ".json": "json"}
+
+# Read buffer for config files; large enough that big files stream in few syscalls
+_READ_BUFFER_SIZE = 64 * 1024
+
+
+def _loads_json(content: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed.
+
+    orjson is stricter than the stdlib (no NaN, 64-bit integers only), so
+    anything it rejects is handed to json.loads, which decides validity and
+    produces the error message.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 class ParserError(Exception):
     """Raised when parsing fails."""
@@ -64,6 +97,14 @@ class VariableResolver:
     # Pattern for ${variable_name}
     VAR_PATTERN = re.compile(r"\$\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
 
+    # Handler method names for resolve(), looked up on the instance so
+    # subclasses can override them
+    _HANDLERS: dict[type, str] = {
+        str: "_resolve_string",
+        dict: "_resolve_dict",
+        list: "_resolve_list",
+    }
+
     def __init__(
         self,
         variables: Optional[dict[str, str]] = None,
@@ -93,22 +134,32 @@ class VariableResolver:
         Returns:
             Value with variables resolved
         """
-        if isinstance(value, str):
-            return self._resolve_string(value)
-        elif isinstance(value, dict):
-            return {k: self.resolve(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self.resolve(item) for item in value]
+        # Loaders produce exact str/dict/list, so the first MRO entry usually
+        # matches; subclasses such as OrderedDict fall through to their base
+        for cls in type(value).__mro__:
+            handler = self._HANDLERS.get(cls)
+            if handler is not None:
+                return getattr(self, handler)(value)
         return value
 
+    def _resolve_dict(self, d: dict) -> dict:
+        """Resolve variables in every value of a dict."""
+        return {k: self.resolve(v) for k, v in d.items()}
+
+    def _resolve_list(self, items: list) -> list:
+        """Resolve variables in every item of a list."""
+        return [self.resolve(item) for item in items]
+
     def _resolve_string(self, s: str) -> str:
         """Resolve variables in a string."""
+        # Most config strings hold no placeholder; skip the regex for them
+        if "${" not in s:
+            return s
+        return self.VAR_PATTERN.sub(self._replace_match, s)
 
-        def replacer(match: re.Match) -> str:
-            var_name = match.group(1)
-            return self._get_variable(var_name, match.group(0))
-
-        return self.VAR_PATTERN.sub(replacer, s)
+    def _replace_match(self, match: re.Match) -> str:
+        """Substitute a single ${name} match."""
+        return self._get_variable(match.group(1), match.group(0))
 
     def _get_variable(self, name: str, default: str) -> str:
         """Get a variable value.
@@ -155,6 +206,10 @@ class MetadataParser:
         configs = parser.parse_directory("conf/spaces/", env="dev")
     """
 
+    # Deepest dict/list nesting accepted in a loaded config, whatever its format.
+    # Checked after parsing, so it bounds what later stages walk, not parse cost.
+    MAX_NESTING_DEPTH = 32
+
     def __init__(
         self,
         variables: Optional[dict[str, str]] = None,
@@ -168,6 +223,9 @@ class MetadataParser:
         """
         self.variables = variables or {}
         self.env = env
+        # Environment variables per (env file, mtime, size); every file in a
+        # directory shares the same env file, so parse_directory reads it once
+        self._env_config_cache: dict[tuple[Path, int, int], dict[str, str]] = {}
 
     def parse(
         self,
@@ -192,16 +250,7 @@ class MetadataParser:
         if not path.exists():
             raise ParserError(f"Config file not found: {path}")
 
-        # Merge variables
-        merged_vars = {**self.variables, **(variables or {})}
-        current_env = env or self.env
-
-        # Load environment config if exists
-        env_vars = self._load_env_config(path.parent, current_env)
-        merged_vars = {**env_vars, **merged_vars}
-
-        # Create resolver
-        resolver = VariableResolver(merged_vars, current_env)
+        resolver = self._make_resolver(path.parent, env, variables)
 
         # Load and parse file
         raw_data = self._load_file(path)
@@ -212,6 +261,37 @@ class MetadataParser:
         # Convert to SpaceConfig objects
         return self._to_space_configs(resolved_data)
 
+    def parse_string(
+        self,
+        text: str,
+        fmt: Literal["yaml", "json"] = "yaml",
+        env: Optional[str] = None,
+        variables: Optional[dict[str, str]] = None,
+        base_path: Optional[Union[str, Path]] = None,
+    ) -> list[SpaceConfig]:
+        """Parse configuration held in memory.
+
+        Args:
+            text: YAML or JSON document
+            fmt: Format of ``text`` ("yaml" or "json")
+            env: Environment name (overrides instance default)
+            variables: Additional variables (merged with instance variables)
+            base_path: Directory to look up environment config from, as
+                ``parse`` does with the config file's directory
+
+        Returns:
+            List of SpaceConfig objects
+
+        Raises:
+            ParserError: If parsing fails
+        """
+        resolver = self._make_resolver(
+            Path(base_path) if base_path is not None else None, env, variables
+        )
+
+        raw_data = self._load_stream(text.encode(), fmt, "<string>")
+        return self._to_space_configs(resolver.resolve(raw_data))
+
     def parse_directory(
         self,
         directory: Union[str, Path],
@@ -302,31 +382,102 @@ class MetadataParser:
         return errors
 
     def _load_file(self, path: Path) -> dict:
-        """Load a YAML or JSON file."""
-        content = path.read_text(encoding="utf-8")
+        """Load a YAML or JSON file, choosing the format from its suffix."""
+        fmt = _FORMAT_BY_SUFFIX.get(path.suffix.lower())
+        # Hand the binary stream to the loader so it reads in chunks
+        # instead of materialising the whole document as one string first
+        with path.open("rb", buffering=_READ_BUFFER_SIZE) as f:
+            return self._load_stream(f, fmt, path)
+
+    def _load_stream(
+        self,
+        source: Union[bytes, BinaryIO],
+        fmt: Optional[str],
+        origin: Union[str, Path],
+    ) -> dict:
+        """Load a YAML or JSON document from bytes or a binary stream.
+
+        Args:
+            source: Document content, or a binary stream positioned at its start
+            fmt: "yaml", "json", or None to try YAML first and then JSON
+            origin: File path or label used in error messages
 
-        if path.suffix.lower() in (".yaml", ".yml"):
+        Raises:
+            ParserError: If the document cannot be parsed
+        """
+        if fmt == "yaml":
             try:
-                data = yaml.safe_load(content)
+                data = yaml.load(source, Loader=_YAMLLoader)
             except yaml.YAMLError as e:
-                raise ParserError(f"Invalid YAML in {path}: {e}")
-        elif path.suffix.lower() == ".json":
+                raise ParserError(f"Invalid YAML in {origin}: {e}")
+        elif fmt == "json":
+            content = source if isinstance(source, bytes) else source.read()
             try:
-                data = json.loads(content)
+                data = _loads_json(content)
             except json.JSONDecodeError as e:
-                raise ParserError(f"Invalid JSON in {path}: {e}")
-        else:
+                raise ParserError(f"Invalid JSON in {origin}: {e}")
+        elif fmt is None:
             # Try YAML first, then JSON
+            content = source if isinstance(source, bytes) else source.read()
             try:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YAMLLoader)
             except Exception:
                 try:
-                    data = json.loads(content)
+                    data = _loads_json(content)
                 except Exception as e:
-                    raise ParserError(f"Could not parse {path} as YAML or JSON: {e}")
+                    raise ParserError(f"Could not parse {origin} as YAML or JSON: {e}")
+        else:
+            raise ParserError(f"Unsupported config format: {fmt}")
 
+        self._check_depth(data, origin)
         return data or {}
 
+    def _make_resolver(
+        self,
+        base_path: Optional[Path],
+        env: Optional[str],
+        variables: Optional[dict[str, str]],
+    ) -> VariableResolver:
+        """Build a resolver from instance, per-call and environment-file variables."""
+        # Merge variables
+        merged_vars = {**self.variables, **(variables or {})}
+        current_env = env or self.env
+
+        # Load environment config if exists
+        if base_path is not None:
+            env_vars = self._load_env_config(base_path, current_env)
+            merged_vars = {**env_vars, **merged_vars}
+
+        return VariableResolver(merged_vars, current_env)
+
+    def _check_depth(self, data: Any, origin: Union[str, Path]) -> None:
+        """Reject documents whose dicts and lists nest deeper than MAX_NESTING_DEPTH.
+
+        This is a post-parse structural limit: the whole document has already
+        been loaded when it runs. It applies to every format and ignores the
+        indentation of block scalars. A container reached through several YAML
+        aliases is only revisited when it sits at a new depth.
+        """
+        seen: set[tuple[int, int]] = set()
+        stack = [(data, 1)]
+        while stack:
+            node, depth = stack.pop()
+            if isinstance(node, dict):
+                children: Iterable[Any] = node.values()
+            elif isinstance(node, list):
+                children = node
+            else:
+                continue
+            if depth > self.MAX_NESTING_DEPTH:
+                raise ParserError(
+                    f"Invalid config in {origin}: "
+                    f"nesting deeper than {self.MAX_NESTING_DEPTH} levels"
+                )
+            if (id(node), depth) in seen:
+                continue
+            seen.add((id(node), depth))
+            stack.extend((child, depth + 1) for child in children)
+
     def _load_env_config(self, base_path: Path, env: str) -> dict[str, str]:
         """Load environment-specific variables from conf/environments/{env}.yaml."""
         # Look for environments directory
@@ -337,7 +488,14 @@ class MetadataParser:
         ]
 
         for env_path in env_paths:
-            if env_path.exists():
+            try:
+                stat = env_path.stat()
+            except OSError:
+                continue
+
+            cache_key = (env_path, stat.st_mtime_ns, stat.st_size)
+            cached = self._env_config_cache.get(cache_key)
+            if cached is None:
                 try:
                     data = self._load_file(env_path)
                     # Flatten variables
@@ -347,9 +505,12 @@ class MetadataParser:
                         variables["workspace_url"] = data["workspace_url"]
                     if "warehouse_id" in data:
                         variables["warehouse_id"] = data["warehouse_id"]
-                    return dict(variables)
+                    cached = dict(variables)
                 except Exception as e:
                     logger.warning(f"Failed to load env config {env_path}: {e}")
+                    continue
+                self._env_config_cache[cache_key] = cached
+            return dict(cached)
 
         return {}
 
@@ -359,10 +520,8 @@ class MetadataParser:
         prefix = f"spaces[{index}]"
 
         # Required fields
-        required = ["space_id", "title", "warehouse_id"]
-        for field in required:
-            if field not in space:
-                errors.append(f"{prefix}: Missing required field '{field}'")
+        for field in SpaceConfig.missing_required(space):
+            errors.append(f"{prefix}: Missing required field '{field}'")
 
         # Validate data_sources
         if "data_sources" in space:
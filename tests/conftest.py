@@ -1,12 +1,14 @@
 """Pytest configuration and fixtures for Genie-Forge tests."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Generator, Union
 from unittest.mock import MagicMock
 
 import pytest
+from click.testing import CliRunner, Result
 
 
 @pytest.fixture
@@ -16,6 +18,30 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared Click test runner (stateless, safe to reuse across tests)."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_output(runner: CliRunner) -> Callable[[str], Result]:
+    """Return ``--help`` results for a command line, rendering each one only once.
+
+    Help text is static, so tests that only inspect it can share one invocation.
+    """
+    from genie_forge.cli import main
+
+    cache: dict[str, Result] = {}
+
+    def _get(command: str = "") -> Result:
+        if command not in cache:
+            cache[command] = runner.invoke(main, [*command.split(), "--help"])
+        return cache[command]
+
+    return _get
+
+
 @pytest.fixture
 def sample_config_dict() -> dict:
     """Sample configuration dictionary using API version 2 format."""
@@ -106,6 +132,25 @@ def sample_json_file(temp_dir: Path, sample_config_dict: dict) -> Path:
     return file_path
 
 
+@pytest.fixture
+def mock_workspace_factory() -> Callable[[Any], MagicMock]:
+    """Return a builder for a WorkspaceClient stand-in whose api_client.do returns a payload.
+
+    Every call reuses one specced mock, resetting the recorded calls first.
+    """
+    from databricks.sdk import WorkspaceClient
+
+    mock_client = MagicMock(spec=WorkspaceClient)
+    mock_client.config.host = "https://test.databricks.com"
+
+    def _make(response: Any) -> MagicMock:
+        mock_client.api_client.do.reset_mock()
+        mock_client.api_client.do.return_value = response
+        return mock_client
+
+    return _make
+
+
 @pytest.fixture
 def mock_workspace_client() -> MagicMock:
     """Create a mock WorkspaceClient."""
@@ -167,6 +212,24 @@ def sample_state_dict() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def write_state() -> Callable[[Path, Union[dict, str]], None]:
+    """Return a helper that plants a state file with a single raw write.
+
+    Accepts the state as a dict or as already-serialized JSON.
+    """
+
+    def _write(path: Path, state: Union[dict, str]) -> None:
+        payload = state if isinstance(state, str) else json.dumps(state)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    return _write
+
+
 @pytest.fixture
 def sample_state_file(temp_dir: Path, sample_state_dict: dict) -> Path:
     """Create a sample state file."""
@@ -1,6 +1,8 @@
 """Unit tests for genie_forge.auth."""
 
 import os
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +16,26 @@ from genie_forge.auth import (
 )
 
 
+class TestProductRegistration:
+    """Tests for the SDK user-agent registration done at package import."""
+
+    def test_registered_by_package_import(self):
+        """A bare ``import genie_forge`` registers the product before any client exists."""
+        code = (
+            "import genie_forge\n"
+            "import databricks.sdk.useragent as ua\n"
+            "print(ua.product())\n"
+            "print(('genie-forge', genie_forge.__version__) in ua.extra())\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        from genie_forge import __version__
+
+        assert result.stdout.splitlines() == [str(("genie-forge", __version__)), "True"]
+
+
 class TestAuthConfig:
     """Tests for AuthConfig dataclass."""
 
@@ -7,12 +7,92 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
 import pytest
-from click.testing import CliRunner
 
 from genie_forge.cli import main
+from genie_forge.cli.common import (
+    OperationCounter,
+    apply_key_value_overrides,
+    fetch_all_spaces_paginated,
+    get_state_environment,
+    load_config_file,
+    load_state_file,
+    parse_comma_separated,
+    parse_serialized_space,
+    sanitize_filename,
+    save_state_file,
+    truncate_string,
+)
+from genie_forge.client import GenieClient
+
+# =============================================================================
+# Static State File Payloads
+# =============================================================================
+
+STATE_FILE = Path(".genie-forge.json")
+
+# Serialized once at import; the state-file tests only need to plant them on disk.
+EMPTY_SPACES_STATE = json.dumps(
+    {
+        "version": "1.0",
+        "environments": {"dev": {"spaces": {}}},
+    }
+)
+SPECIAL_NAMES_STATE = json.dumps(
+    {
+        "version": "1.0",
+        "environments": {
+            "dev": {
+                "spaces": {
+                    "space-with-dashes": {"title": "Space With Dashes"},
+                    "space_with_underscores": {"title": "Space With Underscores"},
+                    "space.with.dots": {"title": "Space With Dots"},
+                }
+            }
+        },
+    }
+)
+LONG_NAME_STATE = json.dumps(
+    {
+        "version": "1.0",
+        "environments": {"dev": {"spaces": {"a" * 200: {"title": "Long Named Space"}}}},
+    }
+)
+SINGLE_SPACE_STATE = json.dumps(
+    {
+        "version": "1.0",
+        "environments": {
+            "dev": {
+                "spaces": {"only_space": {"title": "Only Space", "databricks_space_id": "db123"}}
+            }
+        },
+    }
+)
+UNICODE_SPACE_STATE = json.dumps(
+    {
+        "version": "1.0",
+        "environments": {
+            "dev": {
+                "spaces": {
+                    "日本語space": {
+                        "title": "Japanese Space",
+                        "databricks_space_id": "db123",
+                    }
+                }
+            }
+        },
+    }
+)
+
+
+def _read_state(path: Path = STATE_FILE) -> dict:
+    """Load a state file written by the CLI, decoding straight from bytes."""
+    result: dict = json.loads(path.read_bytes())
+    return result
+
 
 # =============================================================================
 # String Utility Edge Cases
@@ -24,20 +104,14 @@ class TestTruncateStringEdgeCases:
 
     def test_empty_string(self):
         """Test truncating empty string."""
-        from genie_forge.cli.common import truncate_string
-
         assert truncate_string("", max_length=10) == ""
 
     def test_string_equals_max_length(self):
         """Test string exactly at max length."""
-        from genie_forge.cli.common import truncate_string
-
         assert truncate_string("12345", max_length=5) == "12345"
 
     def test_max_length_smaller_than_suffix(self):
         """Test when max_length is smaller than suffix."""
-        from genie_forge.cli.common import truncate_string
-
         # When max_length < suffix length, function still adds suffix
         # This is acceptable behavior - the suffix indicates truncation happened
         result = truncate_string("hello world", max_length=2, suffix="...")
@@ -46,15 +120,11 @@ class TestTruncateStringEdgeCases:
 
     def test_unicode_characters(self):
         """Test with unicode characters."""
-        from genie_forge.cli.common import truncate_string
-
         result = truncate_string("こんにちは世界", max_length=5)
         assert len(result) == 5
 
     def test_emoji_characters(self):
         """Test with emoji characters."""
-        from genie_forge.cli.common import truncate_string
-
         result = truncate_string("🚀🎉🔥🎯💡", max_length=3)
         assert len(result) == 3
 
@@ -64,31 +134,23 @@ class TestSanitizeFilenameEdgeCases:
 
     def test_empty_string(self):
         """Test sanitizing empty string."""
-        from genie_forge.cli.common import sanitize_filename
-
         result = sanitize_filename("")
         assert result == ""
 
     def test_only_special_characters(self):
         """Test string with only special characters."""
-        from genie_forge.cli.common import sanitize_filename
-
         result = sanitize_filename("!@#$%^&*()")
         # Should return empty or minimal safe string
         assert "_" not in result or result == ""
 
     def test_very_long_title(self):
         """Test with very long title."""
-        from genie_forge.cli.common import sanitize_filename
-
         long_title = "a" * 1000
         result = sanitize_filename(long_title, max_length=50)
         assert len(result) <= 50
 
     def test_leading_trailing_whitespace(self):
         """Test title with leading/trailing whitespace."""
-        from genie_forge.cli.common import sanitize_filename
-
         result = sanitize_filename("   hello world   ")
         # Whitespace is converted to underscores, which is acceptable
         # The important thing is the output is a valid filename
@@ -98,15 +160,11 @@ class TestSanitizeFilenameEdgeCases:
 
     def test_multiple_spaces(self):
         """Test title with multiple consecutive spaces."""
-        from genie_forge.cli.common import sanitize_filename
-
         result = sanitize_filename("hello    world")
         assert "__" not in result  # No double underscores
 
     def test_mixed_case_preserved_as_lowercase(self):
         """Test mixed case is converted to lowercase."""
-        from genie_forge.cli.common import sanitize_filename
-
         result = sanitize_filename("HelloWorld")
         assert result == result.lower()
 
@@ -116,34 +174,24 @@ class TestParseCommaSeparatedEdgeCases:
 
     def test_empty_string(self):
         """Test empty string."""
-        from genie_forge.cli.common import parse_comma_separated
-
         assert parse_comma_separated("") == []
 
     def test_only_whitespace(self):
         """Test only whitespace."""
-        from genie_forge.cli.common import parse_comma_separated
-
         assert parse_comma_separated("   ") == []
 
     def test_only_commas(self):
         """Test only commas."""
-        from genie_forge.cli.common import parse_comma_separated
-
         assert parse_comma_separated(",,,") == []
 
     def test_values_with_commas_in_quotes(self):
         """Test values that might have internal structure."""
-        from genie_forge.cli.common import parse_comma_separated
-
         # Note: This function doesn't handle quoted values specially
         result = parse_comma_separated("a,b,c")
         assert len(result) == 3
 
     def test_newlines_in_string(self):
         """Test string with newlines."""
-        from genie_forge.cli.common import parse_comma_separated
-
         result = parse_comma_separated("a,\nb,\nc")
         # Newlines should be preserved in values
         assert len(result) == 3
@@ -154,40 +202,30 @@ class TestApplyKeyValueOverridesEdgeCases:
 
     def test_empty_overrides(self):
         """Test with empty overrides list."""
-        from genie_forge.cli.common import apply_key_value_overrides
-
         config = {"title": "Original"}
         result = apply_key_value_overrides(config, [])
         assert result == config
 
     def test_empty_value(self):
         """Test override with empty value."""
-        from genie_forge.cli.common import apply_key_value_overrides
-
         config = {"title": "Original"}
         result = apply_key_value_overrides(config, ["title="])
         assert result["title"] == ""
 
     def test_value_with_equals_sign(self):
         """Test value containing equals sign."""
-        from genie_forge.cli.common import apply_key_value_overrides
-
         config = {}
         result = apply_key_value_overrides(config, ["equation=a=b+c"])
         assert result["equation"] == "a=b+c"
 
     def test_deeply_nested_key(self):
         """Test deeply nested key creation."""
-        from genie_forge.cli.common import apply_key_value_overrides
-
         config = {}
         result = apply_key_value_overrides(config, ["a.b.c.d.e=value"])
         assert result["a"]["b"]["c"]["d"]["e"] == "value"
 
     def test_override_existing_nested_value(self):
         """Test overriding existing nested value."""
-        from genie_forge.cli.common import apply_key_value_overrides
-
         config = {"data": {"nested": {"value": "old"}}}
         result = apply_key_value_overrides(config, ["data.nested.value=new"])
         assert result["data"]["nested"]["value"] == "new"
@@ -198,13 +236,12 @@ class TestApplyKeyValueOverridesEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestLoadStateFileEdgeCases:
     """Edge cases for load_state_file function."""
 
     def test_empty_json_file(self, tmp_path):
         """Test loading empty JSON file."""
-        from genie_forge.cli.common import load_state_file
-
         state_file = tmp_path / ".genie-forge.json"
         state_file.write_text("{}")
 
@@ -213,8 +250,6 @@ class TestLoadStateFileEdgeCases:
 
     def test_json_array_instead_of_object(self, tmp_path):
         """Test loading JSON array instead of object."""
-        from genie_forge.cli.common import load_state_file
-
         state_file = tmp_path / ".genie-forge.json"
         state_file.write_text("[]")
 
@@ -223,8 +258,6 @@ class TestLoadStateFileEdgeCases:
 
     def test_json_with_unicode(self, tmp_path):
         """Test loading JSON with unicode characters."""
-        from genie_forge.cli.common import load_state_file
-
         state_file = tmp_path / ".genie-forge.json"
         state_file.write_text('{"title": "日本語テスト"}')
 
@@ -233,8 +266,6 @@ class TestLoadStateFileEdgeCases:
 
     def test_very_large_state_file(self, tmp_path):
         """Test loading very large state file."""
-        from genie_forge.cli.common import load_state_file
-
         # Create state with many spaces
         state_data = {
             "version": "1.0",
@@ -250,8 +281,6 @@ class TestLoadStateFileEdgeCases:
 
     def test_state_file_with_null_values(self, tmp_path):
         """Test state file with null values."""
-        from genie_forge.cli.common import load_state_file
-
         state_file = tmp_path / ".genie-forge.json"
         state_file.write_text('{"version": "1.0", "environments": null}')
 
@@ -264,24 +293,18 @@ class TestGetStateEnvironmentEdgeCases:
 
     def test_empty_environments(self):
         """Test with empty environments dict."""
-        from genie_forge.cli.common import get_state_environment
-
         data = {"environments": {}}
         result = get_state_environment(data, "dev", exit_on_error=False)
         assert result is None
 
     def test_environments_is_none(self):
         """Test when environments is None."""
-        from genie_forge.cli.common import get_state_environment
-
         data = {"environments": None}
         result = get_state_environment(data, "dev", exit_on_error=False)
         assert result is None
 
     def test_missing_environments_key(self):
         """Test when environments key is missing."""
-        from genie_forge.cli.common import get_state_environment
-
         data = {"version": "1.0"}
         result = get_state_environment(data, "dev", exit_on_error=False)
         assert result is None
@@ -297,8 +320,6 @@ class TestLoadConfigFileEdgeCases:
 
     def test_empty_yaml_file(self, tmp_path):
         """Test loading empty YAML file."""
-        from genie_forge.cli.common import load_config_file
-
         config_file = tmp_path / "config.yaml"
         config_file.write_text("")
 
@@ -307,8 +328,6 @@ class TestLoadConfigFileEdgeCases:
 
     def test_yaml_with_only_comments(self, tmp_path):
         """Test YAML file with only comments."""
-        from genie_forge.cli.common import load_config_file
-
         config_file = tmp_path / "config.yaml"
         config_file.write_text("# This is a comment\n# Another comment")
 
@@ -317,8 +336,6 @@ class TestLoadConfigFileEdgeCases:
 
     def test_yaml_with_anchors_and_aliases(self, tmp_path):
         """Test YAML with anchors and aliases."""
-        from genie_forge.cli.common import load_config_file
-
         config_file = tmp_path / "config.yaml"
         config_file.write_text(
             """
@@ -336,8 +353,6 @@ space1:
 
     def test_json_with_trailing_comma(self, tmp_path):
         """Test JSON with trailing comma (invalid JSON)."""
-        from genie_forge.cli.common import load_config_file
-
         config_file = tmp_path / "config.json"
         config_file.write_text('{"title": "Test",}')
 
@@ -349,44 +364,40 @@ space1:
 # Parse Serialized Space Edge Cases
 # =============================================================================
 
+# Read-only at every level so tests sharing it cannot mutate the expected document
+NESTED_PAYLOAD = MappingProxyType(
+    {"a": MappingProxyType({"b": MappingProxyType({"c": MappingProxyType({"d": "value"})})})}
+)
+NESTED_SERIALIZED_SPACE = json.dumps(NESTED_PAYLOAD, default=dict)
+
 
 class TestParseSerializedSpaceEdgeCases:
     """Edge cases for parse_serialized_space function."""
 
     def test_none_value(self):
         """Test with None serialized_space."""
-        from genie_forge.cli.common import parse_serialized_space
-
         assert parse_serialized_space({"serialized_space": None}) == {}
 
     def test_empty_dict(self):
         """Test with empty dict serialized_space."""
-        from genie_forge.cli.common import parse_serialized_space
-
         assert parse_serialized_space({"serialized_space": {}}) == {}
 
     def test_empty_string(self):
         """Test with empty string serialized_space."""
-        from genie_forge.cli.common import parse_serialized_space
-
         assert parse_serialized_space({"serialized_space": ""}) == {}
 
     def test_whitespace_string(self):
         """Test with whitespace-only string."""
-        from genie_forge.cli.common import parse_serialized_space
-
         result = parse_serialized_space({"serialized_space": "   "})
         assert result == {}
 
     def test_valid_json_string_with_nested_objects(self):
         """Test valid JSON string with deeply nested objects."""
-        from genie_forge.cli.common import parse_serialized_space
-
-        nested = {"a": {"b": {"c": {"d": "value"}}}}
-        space = {"serialized_space": json.dumps(nested)}
+        space = {"serialized_space": NESTED_SERIALIZED_SPACE}
 
         result = parse_serialized_space(space)
         assert result["a"]["b"]["c"]["d"] == "value"
+        assert result == NESTED_PAYLOAD
 
 
 # =============================================================================
@@ -394,158 +405,93 @@ class TestParseSerializedSpaceEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestInitCommandEdgeCases:
     """Edge cases for init command."""
 
-    def test_init_in_readonly_directory(self, tmp_path):
+    def test_init_in_readonly_directory(self, runner, tmp_path, monkeypatch):
         """Test init when directory might have permission issues."""
-        runner = CliRunner()
-
-        # Use isolated filesystem for clean test
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(main, ["init", "--yes"])
-            assert result.exit_code == 0
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["init", "--yes"])
+        assert result.exit_code == 0
 
-    def test_init_with_existing_gitignore_no_newline(self, tmp_path):
+    def test_init_with_existing_gitignore_no_newline(self, runner, tmp_path, monkeypatch):
         """Test init when .gitignore doesn't end with newline."""
-        runner = CliRunner()
+        monkeypatch.chdir(tmp_path)
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create .gitignore without trailing newline
-            Path(".gitignore").write_text("*.pyc")
+        # Create .gitignore without trailing newline
+        Path(".gitignore").write_text("*.pyc")
 
-            result = runner.invoke(main, ["init", "--yes"])
+        result = runner.invoke(main, ["init", "--yes"])
 
-            assert result.exit_code == 0
-            gitignore = Path(".gitignore").read_text()
-            assert ".genie-forge.json" in gitignore
+        assert result.exit_code == 0
+        gitignore = Path(".gitignore").read_text()
+        assert ".genie-forge.json" in gitignore
 
-    def test_init_idempotent(self, tmp_path):
+    def test_init_idempotent(self, runner, tmp_path, monkeypatch):
         """Test running init multiple times is safe."""
-        runner = CliRunner()
+        monkeypatch.chdir(tmp_path)
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Run init twice
-            result1 = runner.invoke(main, ["init", "--yes"])
-            result2 = runner.invoke(main, ["init", "--yes"])
+        # Run init twice
+        result1 = runner.invoke(main, ["init", "--yes"])
+        result2 = runner.invoke(main, ["init", "--yes"])
 
-            assert result1.exit_code == 0
-            assert result2.exit_code == 0
+        assert result1.exit_code == 0
+        assert result2.exit_code == 0
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestStateListEdgeCases:
     """Edge cases for state-list command."""
 
-    def test_state_list_with_empty_spaces_dict(self, tmp_path):
-        """Test state-list when spaces dict is empty."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            state = {
-                "version": "1.0",
-                "environments": {"dev": {"spaces": {}}},
-            }
-            Path(".genie-forge.json").write_text(json.dumps(state))
-
-            result = runner.invoke(main, ["state-list", "--env", "dev"])
-            assert result.exit_code == 0
-
-    def test_state_list_with_special_characters_in_names(self, tmp_path):
-        """Test state-list with special characters in space names."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            state = {
-                "version": "1.0",
-                "environments": {
-                    "dev": {
-                        "spaces": {
-                            "space-with-dashes": {"title": "Space With Dashes"},
-                            "space_with_underscores": {"title": "Space With Underscores"},
-                            "space.with.dots": {"title": "Space With Dots"},
-                        }
-                    }
-                },
-            }
-            Path(".genie-forge.json").write_text(json.dumps(state))
-
-            result = runner.invoke(main, ["state-list", "--env", "dev"])
-            assert result.exit_code == 0
-
-    def test_state_list_very_long_space_names(self, tmp_path):
-        """Test state-list with very long space names."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            long_name = "a" * 200
-            state = {
-                "version": "1.0",
-                "environments": {"dev": {"spaces": {long_name: {"title": "Long Named Space"}}}},
-            }
-            Path(".genie-forge.json").write_text(json.dumps(state))
-
-            result = runner.invoke(main, ["state-list", "--env", "dev"])
-            assert result.exit_code == 0
+    @pytest.mark.parametrize(
+        "state",
+        [EMPTY_SPACES_STATE, SPECIAL_NAMES_STATE, LONG_NAME_STATE],
+        ids=["empty_spaces_dict", "special_characters_in_names", "very_long_space_names"],
+    )
+    def test_state_list_handles_unusual_spaces(
+        self, runner, tmp_path, write_state, monkeypatch, state
+    ):
+        """Test state-list with empty, special-character, and very long space names."""
+        monkeypatch.chdir(tmp_path)
+        write_state(STATE_FILE, state)
+
+        result = runner.invoke(main, ["state-list", "--env", "dev"])
+        assert result.exit_code == 0
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestStateRemoveEdgeCases:
     """Edge cases for state-remove command."""
 
-    def test_state_remove_last_space_in_env(self, tmp_path):
+    def test_state_remove_last_space_in_env(self, runner, tmp_path, write_state, monkeypatch):
         """Test removing the last space in an environment."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            state = {
-                "version": "1.0",
-                "environments": {
-                    "dev": {
-                        "spaces": {
-                            "only_space": {"title": "Only Space", "databricks_space_id": "db123"}
-                        }
-                    }
-                },
-            }
-            Path(".genie-forge.json").write_text(json.dumps(state))
+        monkeypatch.chdir(tmp_path)
+        write_state(STATE_FILE, SINGLE_SPACE_STATE)
 
-            result = runner.invoke(main, ["state-remove", "only_space", "--env", "dev", "--force"])
-            assert result.exit_code == 0
+        result = runner.invoke(main, ["state-remove", "only_space", "--env", "dev", "--force"])
+        assert result.exit_code == 0
 
-            # Verify space was removed
-            updated = json.loads(Path(".genie-forge.json").read_text())
-            assert len(updated["environments"]["dev"]["spaces"]) == 0
+        # Verify only the space was removed; everything else round-trips unchanged
+        expected = json.loads(SINGLE_SPACE_STATE)
+        del expected["environments"]["dev"]["spaces"]["only_space"]
+        assert _read_state() == expected
 
-    def test_state_remove_with_unicode_space_name(self, tmp_path):
+    def test_state_remove_with_unicode_space_name(self, runner, tmp_path, write_state, monkeypatch):
         """Test removing space with unicode characters in name."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            state = {
-                "version": "1.0",
-                "environments": {
-                    "dev": {
-                        "spaces": {
-                            "日本語space": {
-                                "title": "Japanese Space",
-                                "databricks_space_id": "db123",
-                            }
-                        }
-                    }
-                },
-            }
-            Path(".genie-forge.json").write_text(json.dumps(state))
+        monkeypatch.chdir(tmp_path)
+        write_state(STATE_FILE, UNICODE_SPACE_STATE)
 
-            result = runner.invoke(main, ["state-remove", "日本語space", "--env", "dev", "--force"])
-            # Should handle unicode gracefully
-            assert result.exit_code == 0 or "not found" in result.output.lower()
+        result = runner.invoke(main, ["state-remove", "日本語space", "--env", "dev", "--force"])
+        # Should handle unicode gracefully
+        assert result.exit_code == 0 or "not found" in result.output.lower()
 
 
 class TestSpaceCreateEdgeCases:
     """Edge cases for space-create command."""
 
-    def test_space_create_empty_title(self):
+    def test_space_create_empty_title(self, runner):
         """Test space-create with empty title."""
-        runner = CliRunner()
         result = runner.invoke(
             main,
             ["space-create", "", "--warehouse-id", "wh123", "--tables", "cat.sch.tbl"],
@@ -553,33 +499,32 @@ class TestSpaceCreateEdgeCases:
         # Should fail or handle gracefully
         assert result.exit_code != 0 or "empty" in result.output.lower()
 
-    def test_space_create_title_with_special_chars(self):
+    def test_space_create_title_with_special_chars(self, runner, monkeypatch):
         """Test space-create with special characters in title."""
-        with patch("genie_forge.cli.space_cmd.get_genie_client") as mock:
-            mock_client = MagicMock()
-            mock_client.create_space.return_value = {"id": "new123"}
-            mock.return_value = mock_client
-
-            runner = CliRunner()
-            result = runner.invoke(
-                main,
-                [
-                    "space-create",
-                    "Test Space!@#$%",
-                    "--warehouse-id",
-                    "wh123",
-                    "--tables",
-                    "cat.sch.tbl",
-                    "--profile",
-                    "TEST",
-                ],
-            )
-            # Should handle special characters
-            assert result.exit_code == 0
-
-    def test_space_create_from_nonexistent_file(self, tmp_path):
+        mock_client = MagicMock(spec=GenieClient)
+        mock_client.create_space.return_value = {"id": "new123"}
+        monkeypatch.setattr(
+            "genie_forge.cli.space_cmd.get_genie_client", lambda *args, **kwargs: mock_client
+        )
+
+        result = runner.invoke(
+            main,
+            [
+                "space-create",
+                "Test Space!@#$%",
+                "--warehouse-id",
+                "wh123",
+                "--tables",
+                "cat.sch.tbl",
+                "--profile",
+                "TEST",
+            ],
+        )
+        # Should handle special characters
+        assert result.exit_code == 0
+
+    def test_space_create_from_nonexistent_file(self, runner, tmp_path):
         """Test space-create from non-existent file."""
-        runner = CliRunner()
         result = runner.invoke(
             main,
             ["space-create", "--from-file", str(tmp_path / "nonexistent.yaml")],
@@ -587,13 +532,28 @@ class TestSpaceCreateEdgeCases:
         assert result.exit_code != 0
 
 
+# One valid config alongside files validate must skip
+MIXED_CONFIG_DIR_FILES = {
+    "valid.yaml": """
+version: 1
+spaces:
+  - space_id: test
+    title: Test
+    warehouse_id: wh123
+    data_sources:
+      tables:
+        - identifier: cat.sch.tbl
+""",
+    "readme.txt": "This is not a config file",
+    "notes.md": "# Notes",
+}
+
+
 class TestValidateCommandEdgeCases:
     """Edge cases for validate command."""
 
-    def test_validate_empty_config_file(self, tmp_path):
+    def test_validate_empty_config_file(self, runner, tmp_path):
         """Test validate with empty config file."""
-        runner = CliRunner()
-
         config_file = tmp_path / "empty.yaml"
         config_file.write_text("")
 
@@ -605,38 +565,22 @@ class TestValidateCommandEdgeCases:
             or "invalid" in result.output.lower()
         )
 
-    def test_validate_malformed_yaml(self, tmp_path):
+    def test_validate_malformed_yaml(self, runner, tmp_path):
         """Test validate with malformed YAML."""
-        runner = CliRunner()
-
         config_file = tmp_path / "malformed.yaml"
         config_file.write_text("title: [invalid yaml")
 
         result = runner.invoke(main, ["validate", "--config", str(config_file)])
         assert result.exit_code != 0
 
-    def test_validate_directory_with_mixed_files(self, tmp_path):
+    def test_validate_directory_with_mixed_files(self, runner, tmp_path):
         """Test validate with directory containing mixed file types."""
-        runner = CliRunner()
-
         # Create directory with YAML, JSON, and other files
         config_dir = tmp_path / "configs"
         config_dir.mkdir()
 
-        (config_dir / "valid.yaml").write_text(
-            """
-version: 1
-spaces:
-  - space_id: test
-    title: Test
-    warehouse_id: wh123
-    data_sources:
-      tables:
-        - identifier: cat.sch.tbl
-"""
-        )
-        (config_dir / "readme.txt").write_text("This is not a config file")
-        (config_dir / "notes.md").write_text("# Notes")
+        for name, content in MIXED_CONFIG_DIR_FILES.items():
+            (config_dir / name).write_text(content)
 
         result = runner.invoke(main, ["validate", "--config", str(config_dir)])
         # Should only process YAML/JSON files
@@ -651,40 +595,29 @@ spaces:
 class TestAPIResponseEdgeCases:
     """Edge cases for handling API responses."""
 
-    def test_fetch_spaces_empty_response(self):
+    def test_fetch_spaces_empty_response(self, mock_workspace_factory):
         """Test handling empty API response."""
-        from genie_forge.cli.common import fetch_all_spaces_paginated
-
-        mock_client = MagicMock()
-        mock_client._api_get.return_value = {}
+        client = GenieClient(client=mock_workspace_factory({}))
 
-        result = fetch_all_spaces_paginated(mock_client, show_progress=False)
+        result = fetch_all_spaces_paginated(client, show_progress=False)
         assert result == []
 
-    def test_fetch_spaces_null_spaces_field(self):
+    def test_fetch_spaces_null_spaces_field(self, mock_workspace_factory):
         """Test handling null spaces field in response."""
-        from genie_forge.cli.common import fetch_all_spaces_paginated
+        client = GenieClient(client=mock_workspace_factory({"spaces": None}))
 
-        mock_client = MagicMock()
-        mock_client._api_get.return_value = {"spaces": None}
-
-        result = fetch_all_spaces_paginated(mock_client, show_progress=False)
+        result = fetch_all_spaces_paginated(client, show_progress=False)
         assert result == []
 
-    def test_fetch_spaces_non_dict_response(self):
+    def test_fetch_spaces_non_dict_response(self, mock_workspace_factory):
         """Test handling non-dict response."""
-        from genie_forge.cli.common import fetch_all_spaces_paginated
-
-        mock_client = MagicMock()
-        mock_client._api_get.return_value = "not a dict"
+        client = GenieClient(client=mock_workspace_factory("not a dict"))
 
-        result = fetch_all_spaces_paginated(mock_client, show_progress=False)
+        result = fetch_all_spaces_paginated(client, show_progress=False)
         assert result == []
 
     def test_space_with_missing_optional_fields(self):
         """Test handling space with missing optional fields."""
-        from genie_forge.cli.common import parse_serialized_space
-
         # Space with minimal fields
         space = {"id": "123", "title": "Minimal Space"}
         result = parse_serialized_space(space)
@@ -696,13 +629,12 @@ class TestAPIResponseEdgeCases:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestConcurrencyEdgeCases:
     """Edge cases for concurrent operations."""
 
     def test_save_state_creates_file_atomically(self, tmp_path):
         """Test that state file is saved atomically."""
-        from genie_forge.cli.common import load_state_file, save_state_file
-
         state_file = tmp_path / ".genie-forge.json"
 
         # Save state
@@ -713,6 +645,18 @@ class TestConcurrencyEdgeCases:
         loaded = load_state_file(state_file, exit_on_error=False)
         assert loaded == state_data
 
+    def test_repeated_save_load_roundtrip(self, tmp_path):
+        """Test back-to-back saves to one path never leave stale or partial content."""
+        state_file = tmp_path / ".genie-forge.json"
+
+        for i in range(50):
+            state_data = {
+                "version": "1.0",
+                "environments": {f"env_{i}": {"spaces": {f"space_{i}": {"title": "x" * i}}}},
+            }
+            save_state_file(state_data, state_file)
+            assert load_state_file(state_file, exit_on_error=False) == state_data
+
 
 # =============================================================================
 # Operation Counter Edge Cases
@@ -724,8 +668,6 @@ class TestOperationCounterEdgeCases:
 
     def test_all_zero_counters(self):
         """Test summary with all zero counters."""
-        from genie_forge.cli.common import OperationCounter
-
         counter = OperationCounter()
         assert counter.summary() == "No operations"
         assert counter.total == 0
@@ -733,8 +675,6 @@ class TestOperationCounterEdgeCases:
 
     def test_only_failed_operations(self):
         """Test with only failed operations."""
-        from genie_forge.cli.common import OperationCounter
-
         counter = OperationCounter()
         counter.failed = 5
 
@@ -744,8 +684,6 @@ class TestOperationCounterEdgeCases:
 
     def test_large_numbers(self):
         """Test with very large numbers."""
-        from genie_forge.cli.common import OperationCounter
-
         counter = OperationCounter()
         counter.created = 1000000
         counter.updated = 500000
@@ -756,8 +694,6 @@ class TestOperationCounterEdgeCases:
 
     def test_detail_with_empty_strings(self):
         """Test adding details with empty strings."""
-        from genie_forge.cli.common import OperationCounter
-
         counter = OperationCounter()
         counter.add_detail("", "", "", "")
 
@@ -13,10 +13,12 @@ should handle gracefully anyway."
 from __future__ import annotations
 
 import json
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
 import yaml
+from databricks.sdk import WorkspaceClient
 
 from genie_forge.client import GenieClient
 from genie_forge.models import (
@@ -25,10 +27,37 @@ from genie_forge.models import (
     SpaceConfig,
     TableConfig,
 )
-from genie_forge.parsers import MetadataParser
+from genie_forge.parsers import MetadataParser, ParserError
 from genie_forge.serializer import SpaceSerializer
 from genie_forge.state import StateManager
 
+# Space IDs containing characters that could break paths or state-file keys
+SPECIAL_SPACE_IDS = (
+    "space/with/slashes",
+    "space\\with\\backslashes",
+    "space:with:colons",
+    "space<with>brackets",
+    'space"with"quotes',
+    "space\nwith\nnewlines",
+)
+
+# Degenerate state-file contents, pre-encoded since they are written verbatim
+EMPTY_STATE_BYTES = b""
+WHITESPACE_STATE_BYTES = b"   \n\n\t   "
+NULL_STATE_BYTES = b"null"
+ARRAY_STATE_BYTES = b"[]"
+FUTURE_VERSION_STATE_BYTES = json.dumps(
+    {
+        "version": "99.0",  # Future version
+        "project_id": "test",
+        "environments": {},
+    }
+).encode("utf-8")
+
+# Read-only create response shared by the bulk tests (GenieClient only reads it)
+CREATE_RESPONSE = MappingProxyType({"space": MappingProxyType({"id": "new-id"})})
+
+
 # =============================================================================
 # Impossible API Responses
 # =============================================================================
@@ -37,15 +66,13 @@ from genie_forge.state import StateManager
 class TestImpossibleAPIResponses:
     """Tests for impossible/malformed API responses."""
 
-    def test_api_returns_none(self):
+    def test_api_returns_none(self, mock_workspace_factory):
         """Test handling when API returns None instead of response.
 
         Note: list_spaces handles None response by treating it as empty list.
         This is actually good defensive behavior.
         """
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = None
+        mock_client = mock_workspace_factory(None)
 
         client = GenieClient(client=mock_client)
 
@@ -58,11 +85,9 @@ class TestImpossibleAPIResponses:
             # Raising is also acceptable
             pass
 
-    def test_api_returns_string_instead_of_dict(self):
+    def test_api_returns_string_instead_of_dict(self, mock_workspace_factory):
         """Test handling when API returns string instead of dict."""
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = "error message"
+        mock_client = mock_workspace_factory("error message")
 
         client = GenieClient(client=mock_client)
 
@@ -74,11 +99,9 @@ class TestImpossibleAPIResponses:
         except Exception:
             pass  # Exception is acceptable
 
-    def test_api_returns_integer_instead_of_dict(self):
+    def test_api_returns_integer_instead_of_dict(self, mock_workspace_factory):
         """Test handling when API returns integer."""
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = 42
+        mock_client = mock_workspace_factory(42)
 
         client = GenieClient(client=mock_client)
 
@@ -88,19 +111,19 @@ class TestImpossibleAPIResponses:
         except Exception:
             pass  # Exception is acceptable
 
-    def test_api_returns_nested_none_values(self):
+    def test_api_returns_nested_none_values(self, mock_workspace_factory):
         """Test handling deeply nested None values in response."""
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = {
-            "spaces": [
-                {
-                    "id": None,
-                    "title": None,
-                    "serialized_space": None,
-                }
-            ]
-        }
+        mock_client = mock_workspace_factory(
+            {
+                "spaces": [
+                    {
+                        "id": None,
+                        "title": None,
+                        "serialized_space": None,
+                    }
+                ]
+            }
+        )
 
         client = GenieClient(client=mock_client)
         spaces = client.list_spaces()
@@ -130,13 +153,19 @@ class TestImpossibleAPIResponses:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestImpossibleStateConditions:
     """Tests for impossible state file conditions."""
 
-    def test_state_file_is_empty(self, tmp_path):
-        """Test handling when state file is empty."""
+    @pytest.mark.parametrize(
+        "payload",
+        [EMPTY_STATE_BYTES, WHITESPACE_STATE_BYTES, NULL_STATE_BYTES, ARRAY_STATE_BYTES],
+        ids=["empty", "just_whitespace", "null_json", "array_json"],
+    )
+    def test_degenerate_state_file_starts_fresh(self, tmp_path, payload):
+        """Test that empty, whitespace, null, and array state files fall back to new state."""
         state_file = tmp_path / ".genie-forge.json"
-        state_file.write_text("")
+        state_file.write_bytes(payload)
 
         manager = StateManager(state_file=state_file, project_id="test")
 
@@ -144,48 +173,10 @@ class TestImpossibleStateConditions:
         state = manager.state
         assert state.project_id == "test"
 
-    def test_state_file_is_just_whitespace(self, tmp_path):
-        """Test handling when state file is just whitespace."""
-        state_file = tmp_path / ".genie-forge.json"
-        state_file.write_text("   \n\n\t   ")
-
-        manager = StateManager(state_file=state_file, project_id="test")
-
-        # Should create new state
-        state = manager.state
-        assert state is not None
-
-    def test_state_file_is_null_json(self, tmp_path):
-        """Test handling when state file contains null."""
-        state_file = tmp_path / ".genie-forge.json"
-        state_file.write_text("null")
-
-        manager = StateManager(state_file=state_file, project_id="test")
-
-        # Should create new state
-        state = manager.state
-        assert state is not None
-
-    def test_state_file_is_array_json(self, tmp_path):
-        """Test handling when state file is array instead of object."""
-        state_file = tmp_path / ".genie-forge.json"
-        state_file.write_text("[]")
-
-        manager = StateManager(state_file=state_file, project_id="test")
-
-        # Should create new state
-        state = manager.state
-        assert state is not None
-
     def test_state_file_has_future_version(self, tmp_path):
         """Test handling state file with unknown future version."""
-        state_data = {
-            "version": "99.0",  # Future version
-            "project_id": "test",
-            "environments": {},
-        }
         state_file = tmp_path / ".genie-forge.json"
-        state_file.write_text(json.dumps(state_data))
+        state_file.write_bytes(FUTURE_VERSION_STATE_BYTES)
 
         manager = StateManager(state_file=state_file)
 
@@ -193,7 +184,7 @@ class TestImpossibleStateConditions:
         state = manager.state
         assert state.project_id == "test"
 
-    def test_state_with_unknown_status(self, tmp_path):
+    def test_state_with_unknown_status(self, tmp_path, write_state):
         """Test handling state with unknown SpaceStatus value."""
         state_data = {
             "version": "1.0",
@@ -213,7 +204,7 @@ class TestImpossibleStateConditions:
             },
         }
         state_file = tmp_path / ".genie-forge.json"
-        state_file.write_text(json.dumps(state_data))
+        write_state(state_file, state_data)
 
         # Should either handle gracefully or raise clear error
         try:
@@ -276,29 +267,20 @@ a: &anchor
         with pytest.raises(Exception):
             TableConfig(identifier="   ")
 
-    def test_space_id_with_special_characters(self):
-        """Test space_id with special characters."""
-        # Some characters might cause issues in state file
-        special_ids = [
-            "space/with/slashes",
-            "space\\with\\backslashes",
-            "space:with:colons",
-            "space<with>brackets",
-            'space"with"quotes',
-            "space\nwith\nnewlines",
-        ]
-
-        for space_id in special_ids:
-            try:
-                config = SpaceConfig(
-                    space_id=space_id,
-                    title="Test",
-                    warehouse_id="wh",
-                )
-                # If it works, it should preserve the ID
-                assert config.space_id == space_id
-            except Exception:
-                pass  # Rejection is acceptable
+    @pytest.mark.parametrize(
+        "space_id",
+        SPECIAL_SPACE_IDS,
+        ids=["slashes", "backslashes", "colons", "brackets", "quotes", "newlines"],
+    )
+    def test_space_id_with_special_characters(self, space_id):
+        """Test space_id with special characters is accepted and preserved verbatim."""
+        # space_id is a free-form logical key; escaping is the state file's job
+        config = SpaceConfig(
+            space_id=space_id,
+            title="Test",
+            warehouse_id="wh",
+        )
+        assert config.space_id == space_id
 
 
 # =============================================================================
@@ -306,56 +288,44 @@ a: &anchor
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def minimal_config() -> SpaceConfig:
+    """Minimal config shared by the hash tests (never mutated)."""
+    return SpaceConfig.minimal(
+        space_id="test",
+        title="Test",
+        warehouse_id="wh",
+        tables=["c.s.t"],
+    )
+
+
 class TestImpossibleHashConditions:
     """Tests for impossible hash/checksum conditions."""
 
-    def test_different_configs_same_hash(self):
+    def test_different_configs_same_hash(self, minimal_config):
         """Test that different configs produce different hashes."""
-        config1 = SpaceConfig.minimal(
-            space_id="test1",
-            title="Test 1",
-            warehouse_id="wh",
-            tables=["c.s.t"],
-        )
-        config2 = SpaceConfig.minimal(
+        other = SpaceConfig.minimal(
             space_id="test2",
             title="Test 2",
             warehouse_id="wh",
             tables=["c.s.t"],
         )
 
-        # Different configs should have different hashes
-        hash1 = config1.config_hash()
-        hash2 = config2.config_hash()
-
         # They should be different (hash collision is theoretically possible
         # but extremely unlikely)
-        assert hash1 != hash2
+        assert minimal_config.config_hash() != other.config_hash()
 
-    def test_hash_is_deterministic(self):
+    def test_hash_is_deterministic(self, minimal_config):
         """Test that hash is deterministic (same input = same output)."""
-        config = SpaceConfig.minimal(
-            space_id="test",
-            title="Test",
-            warehouse_id="wh",
-            tables=["c.s.t"],
-        )
-
-        hashes = [config.config_hash() for _ in range(10)]
+        expected = minimal_config.config_hash()
 
         # All hashes should be identical
-        assert len(set(hashes)) == 1
+        assert all(minimal_config.config_hash() == expected for _ in range(10))
 
-    def test_hash_not_affected_by_order(self):
+    def test_hash_not_affected_by_order(self, minimal_config):
         """Test that hash is not affected by field order in input."""
-        # Create two configs with same content
-        config1 = SpaceConfig.minimal(
-            space_id="test",
-            title="Test",
-            warehouse_id="wh",
-            tables=["c.s.t"],
-        )
-        config2 = SpaceConfig.minimal(
+        # Same content built independently
+        rebuilt = SpaceConfig.minimal(
             space_id="test",
             title="Test",
             warehouse_id="wh",
@@ -363,7 +333,7 @@ class TestImpossibleHashConditions:
         )
 
         # Same content should have same hash
-        assert config1.config_hash() == config2.config_hash()
+        assert rebuilt.config_hash() == minimal_config.config_hash()
 
 
 # =============================================================================
@@ -371,6 +341,7 @@ class TestImpossibleHashConditions:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestImpossibleTimingConditions:
     """Tests for impossible timing/race conditions."""
 
@@ -388,7 +359,7 @@ class TestImpossibleTimingConditions:
 
         assert state_file.exists()
 
-    def test_state_read_during_write(self, tmp_path):
+    def test_state_read_during_write(self, tmp_path, write_state):
         """Test reading state file during write (simulated race)."""
         state_file = tmp_path / ".genie-forge.json"
 
@@ -398,7 +369,7 @@ class TestImpossibleTimingConditions:
             "project_id": "test",
             "environments": {},
         }
-        state_file.write_text(json.dumps(initial_data))
+        write_state(state_file, initial_data)
 
         # Create manager
         manager = StateManager(state_file=state_file)
@@ -415,6 +386,7 @@ class TestImpossibleTimingConditions:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="filesystem")
 class TestImpossibleParserConditions:
     """Tests for impossible parser conditions."""
 
@@ -429,25 +401,19 @@ class TestImpossibleParserConditions:
             parser.parse(binary_file)
 
     def test_parse_huge_file(self, tmp_path):
-        """Test parsing extremely large file."""
+        """Test parsing extremely large file is streamed through in full."""
         # Create a 1MB YAML file
         huge_content = (
-            "spaces:\n" + "  - space_id: test\n    title: Test\n    warehouse_id: wh\n" * 10000
+            b"spaces:\n" + b"  - space_id: test\n    title: Test\n    warehouse_id: wh\n" * 10000
         )
         huge_file = tmp_path / "huge.yaml"
-        huge_file.write_text(huge_content)
+        huge_file.write_bytes(huge_content)
 
         parser = MetadataParser()
+        configs = parser.parse(huge_file)
 
-        # Should either parse or fail with memory error
-        try:
-            configs = parser.parse(huge_file)
-            # If it works, should have many spaces
-            assert len(configs) > 0
-        except MemoryError:
-            pass  # Acceptable
-        except Exception:
-            pass  # Other errors acceptable for huge files
+        assert len(configs) == 10000
+        assert configs[-1].warehouse_id == "wh"
 
     def test_parse_deeply_nested_yaml(self, tmp_path):
         """Test parsing extremely deeply nested YAML.
@@ -473,62 +439,136 @@ class TestImpossibleParserConditions:
         except (RecursionError, yaml.YAMLError):
             pass  # Acceptable for very deep nesting
 
+    def test_parser_rejects_excessive_nesting(self, tmp_path):
+        """Test the parser refuses YAML nested beyond MAX_NESTING_DEPTH."""
+        depth = MetadataParser.MAX_NESTING_DEPTH + 1
+        lines = ["  " * i + f"level_{i}:" for i in range(depth)]
+        lines.append("  " * depth + "value: deep")
+
+        nested_file = tmp_path / "nested.yaml"
+        nested_file.write_text("\n".join(lines))
+
+        with pytest.raises(ParserError, match="nesting deeper than"):
+            MetadataParser().parse(nested_file)
+
+    @pytest.mark.parametrize(
+        "extra_depth, accepted", [(0, True), (1, False)], ids=["at_limit", "one_over_limit"]
+    )
+    def test_parser_nesting_limit_boundary(self, tmp_path, extra_depth, accepted):
+        """Test a document nested exactly MAX_NESTING_DEPTH levels deep is accepted."""
+        # Root mapping, spaces list and space mapping make up the first three levels
+        notes: object = "deep"
+        for i in range(MetadataParser.MAX_NESTING_DEPTH - 3 + extra_depth):
+            notes = {f"level_{i}": notes}
+        space = {
+            "space_id": "nested",
+            "title": "Nested",
+            "warehouse_id": "wh",
+            "data_sources": {"tables": [{"identifier": "c.s.t"}]},
+            "notes": notes,
+        }
+        nested_file = tmp_path / "nested.yaml"
+        nested_file.write_text(yaml.safe_dump({"spaces": [space]}))
+
+        if accepted:
+            assert MetadataParser().parse(nested_file)[0].space_id == "nested"
+        else:
+            with pytest.raises(ParserError, match="nesting deeper than"):
+                MetadataParser().parse(nested_file)
+
+    def test_parser_rejects_excessive_nesting_in_any_format(self, tmp_path):
+        """Test the depth limit also covers JSON and files with unknown suffixes."""
+        nested: dict = {"value": "deep"}
+        for i in range(MetadataParser.MAX_NESTING_DEPTH):
+            nested = {f"level_{i}": nested}
+
+        for name in ("nested.json", "nested.conf"):
+            nested_file = tmp_path / name
+            nested_file.write_text(json.dumps(nested))
+            with pytest.raises(ParserError, match="nesting deeper than"):
+                MetadataParser().parse(nested_file)
+
+    def test_parser_accepts_deeply_indented_block_scalar(self, tmp_path):
+        """Test indentation inside a block scalar does not count as nesting."""
+        indent = " " * (MetadataParser.MAX_NESTING_DEPTH * 2 + 10)
+        config_file = tmp_path / "space.yaml"
+        config_file.write_text(
+            "spaces:\n"
+            "  - space_id: deep_sql\n"
+            "    title: Deep SQL\n"
+            "    warehouse_id: wh\n"
+            "    data_sources:\n"
+            "      tables:\n"
+            "        - identifier: c.s.t\n"
+            "    instructions:\n"
+            "      example_question_sqls:\n"
+            "        - question: Nested query?\n"
+            "          sql: |\n"
+            "            SELECT *\n"
+            f"            {indent}FROM c.s.t\n"
+        )
+
+        configs = MetadataParser().parse(config_file)
+
+        sql = configs[0].instructions.example_question_sqls[0].sql
+        assert sql == [f"SELECT *\n{indent}FROM c.s.t\n"]
+
 
 # =============================================================================
 # Impossible Network Conditions
 # =============================================================================
 
 
+@pytest.fixture(scope="class")
+def genie():
+    """Mocked WorkspaceClient and the GenieClient wrapping it, shared by a test class."""
+    mock_client = MagicMock(spec=WorkspaceClient)
+    mock_client.config.host = "https://test.databricks.com"
+    return mock_client, GenieClient(client=mock_client)
+
+
 class TestImpossibleNetworkConditions:
     """Tests for impossible network conditions."""
 
-    def test_negative_rate_limit(self):
-        """Test bulk operations with negative rate limit."""
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = {"space": {"id": "new-id"}}
+    @staticmethod
+    def _respond(mock_client, response):
+        """Reset recorded calls and make every API call return ``response``."""
+        mock_client.api_client.do.reset_mock()
+        mock_client.api_client.do.return_value = response
 
-        client = GenieClient(client=mock_client)
+    def test_negative_rate_limit(self, genie):
+        """Test bulk operations with negative rate limit."""
+        mock_client, client = genie
+        self._respond(mock_client, CREATE_RESPONSE)
 
         configs = [{"title": "Test", "warehouse_id": "wh", "tables": ["c.s.t"]}]
 
-        # Negative rate limit should be treated as no limit or zero
+        # Negative rate limit is treated as no limit
         result = client.bulk_create(configs, rate_limit=-1.0)
         assert result.total == 1
+        assert result.success == 1
 
-    def test_zero_max_workers(self):
+    def test_zero_max_workers(self, genie):
         """Test bulk operations with zero workers."""
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = {"space": {"id": "new-id"}}
-
-        client = GenieClient(client=mock_client)
+        mock_client, client = genie
+        self._respond(mock_client, CREATE_RESPONSE)
 
         configs = [{"title": "Test", "warehouse_id": "wh", "tables": ["c.s.t"]}]
 
-        # Zero workers should fail or use minimum 1
-        try:
-            result = client.bulk_create(configs, max_workers=0)
-            # If it works, should complete
-            assert result.total == 1
-        except Exception:
-            pass  # Exception is acceptable
+        # Zero workers is clamped to a single worker
+        result = client.bulk_create(configs, max_workers=0)
+        assert result.total == 1
+        assert result.success == 1
 
-    def test_negative_max_pages(self):
+    def test_negative_max_pages(self, genie):
         """Test list with negative max_pages."""
-        mock_client = MagicMock()
-        mock_client.config.host = "https://test.databricks.com"
-        mock_client.api_client.do.return_value = {"spaces": []}
+        mock_client, client = genie
+        self._respond(mock_client, {"spaces": []})
 
-        client = GenieClient(client=mock_client)
-
-        # Negative max_pages should be treated as 0 or minimum
-        try:
-            spaces = client.list_spaces(max_pages=-1)
-            # Should return something
-            assert isinstance(spaces, list)
-        except Exception:
-            pass  # Exception is acceptable
+        # Negative max_pages is clamped so the first page is still fetched
+        spaces = client.list_spaces(max_pages=-1)
+        assert spaces == []
+        mock_client.api_client.do.assert_called_once()
 
 
 # =============================================================================
@@ -569,7 +609,7 @@ class TestDataIntegrityEdgeCases:
         assert col.column_name == "test"
 
     def test_unicode_normalization(self):
-        """Test that Unicode is handled consistently."""
+        """Test that canonically equivalent titles and questions are normalized consistently."""
         # Same character, different encodings
         titles = [
             "café",  # Composed form
@@ -582,10 +622,13 @@ class TestDataIntegrityEdgeCases:
                 space_id="test",
                 title=title,
                 warehouse_id="wh",
+                sample_questions=[f"Open {title}?", {"question": [f"Close {title}?"]}],
             )
             configs.append(config)
 
-        # Behavior depends on Python's handling
-        # Just ensure no crashes
-        for config in configs:
-            assert len(config.title) > 0
+        # Both spellings are NFC-normalized to the composed form, including
+        # sample questions given in the plain string form
+        assert configs[0].title == configs[1].title == "café"
+        assert configs[0].sample_questions == configs[1].sample_questions
+        assert configs[1].sample_questions[0] == "Open café?"
+        assert configs[0].config_hash() == configs[1].config_hash()
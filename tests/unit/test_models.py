@@ -1,5 +1,7 @@
 """Unit tests for genie_forge.models."""
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
@@ -58,6 +60,12 @@ class TestColumnConfig:
         col = ColumnConfig(column_name="test", description="Single description")
         assert col.description == ["Single description"]
 
+    def test_column_is_frozen(self):
+        """Test that leaf models reject attribute assignment."""
+        col = ColumnConfig(column_name="test")
+        with pytest.raises(ValidationError):
+            col.column_name = "other"
+
     def test_description_none_to_empty_list(self):
         """Test that None description becomes empty list."""
         col = ColumnConfig(column_name="test", description=None)
@@ -321,6 +329,31 @@ class TestSpaceConfig:
         )
         assert space1.config_hash() != space2.config_hash()
 
+    def test_config_hash_follows_nested_mutation(self):
+        """Test that in-place edits to nested lists change the config hash."""
+        space = SpaceConfig.minimal(
+            space_id="test",
+            title="Test Space",
+            warehouse_id="wh123",
+            tables=["cat.sch.tbl"],
+        )
+        original = space.config_hash()
+
+        space.data_sources.tables.append(TableConfig(identifier="cat.sch.other"))
+        with_table = space.config_hash()
+        assert with_table != original
+
+        space.sample_questions.append("How many rows?")
+        assert space.config_hash() not in (original, with_table)
+
+    def test_warehouse_id_interned(self):
+        """Test that spaces on the same warehouse share one warehouse_id string."""
+        first, second = (
+            SpaceConfig(space_id=f"s{i}", title="T", warehouse_id="".join(["wh", "123"]))
+            for i in range(2)
+        )
+        assert first.warehouse_id is second.warehouse_id
+
     def test_get_table_identifiers(self):
         """Test getting table identifiers."""
         space = SpaceConfig(
@@ -378,6 +411,19 @@ class TestPlan:
         assert "1 to create" in summary
         assert "1 to update" in summary
 
+    def test_plan_action_counts_follow_appends(self):
+        """Test action counts reflect items appended after construction."""
+        plan = Plan(environment="dev")
+        plan.items.append(PlanItem(logical_id="same", action=PlanAction.NO_CHANGE))
+        assert plan.has_changes is False
+
+        plan.items.append(PlanItem(logical_id="old", action=PlanAction.DESTROY))
+        counts = plan.action_counts()
+        assert counts[PlanAction.DESTROY] == 1
+        assert counts[PlanAction.NO_CHANGE] == 1
+        assert counts[PlanAction.CREATE] == 0
+        assert plan.has_changes is True
+
 
 class TestSpaceState:
     """Tests for SpaceState model."""
@@ -402,11 +448,6 @@ class TestSpaceState:
 class TestColumnConfigEdgeCases:
     """Edge case tests for ColumnConfig."""
 
-    def test_empty_description_list(self):
-        """Test column with empty description list."""
-        col = ColumnConfig(column_name="test", description=[])
-        assert col.description == []
-
     def test_description_with_empty_string(self):
         """Test column with empty string in description list."""
         col = ColumnConfig(column_name="test", description=[""])
@@ -435,11 +476,6 @@ class TestColumnConfigEdgeCases:
 class TestSampleQuestionEdgeCases:
     """Edge case tests for SampleQuestion."""
 
-    def test_empty_question_list(self):
-        """Test sample question with empty question list."""
-        sq = SampleQuestion(question=[])
-        assert sq.question == []
-
     def test_question_with_special_characters(self):
         """Test sample question with special characters."""
         sq = SampleQuestion(question=["What's the revenue for Q1'23?"])
@@ -454,11 +490,6 @@ class TestSampleQuestionEdgeCases:
 class TestTextInstructionEdgeCases:
     """Edge case tests for TextInstruction."""
 
-    def test_empty_content_list(self):
-        """Test text instruction with empty content list."""
-        ti = TextInstruction(content=[])
-        assert ti.content == []
-
     def test_content_with_code_block(self):
         """Test text instruction with SQL code block."""
         ti = TextInstruction(content=["```sql\nSELECT * FROM table\n```"])
@@ -477,15 +508,6 @@ class TestParameterConfigEdgeCases:
         )
         assert param.default_value is None
 
-    def test_parameter_with_empty_description(self):
-        """Test parameter with empty description."""
-        param = ParameterConfig(
-            name="test",
-            type_hint="STRING",
-            description=[],
-        )
-        assert param.description == []
-
     def test_description_string_normalized_to_list(self):
         """Test that string description is normalized to list."""
         param = ParameterConfig(
@@ -499,23 +521,14 @@ class TestParameterConfigEdgeCases:
 class TestExampleQuestionSQLEdgeCases:
     """Edge case tests for ExampleQuestionSQL."""
 
-    def test_empty_parameters_list(self):
-        """Test example SQL with empty parameters list."""
-        eq = ExampleQuestionSQL(
-            question=["Test?"],
-            sql=["SELECT 1"],
-            parameters=[],
-        )
-        assert eq.parameters == []
+    # Required fields shared by tests that only vary one optional field
+    BASE_KWARGS = MappingProxyType({"question": ["Test?"], "sql": ["SELECT 1"]})
 
-    def test_empty_usage_guidance(self):
-        """Test example SQL with empty usage guidance."""
-        eq = ExampleQuestionSQL(
-            question=["Test?"],
-            sql=["SELECT 1"],
-            usage_guidance=[],
-        )
-        assert eq.usage_guidance == []
+    @pytest.mark.parametrize("field", ["parameters", "usage_guidance"])
+    def test_empty_optional_list(self, field):
+        """Test example SQL with an explicitly empty optional list."""
+        eq = ExampleQuestionSQL(**self.BASE_KWARGS, **{field: []})
+        assert getattr(eq, field) == []
 
     def test_multiline_sql_in_list(self):
         """Test example SQL with multiline SQL."""
@@ -583,6 +596,21 @@ class TestJoinSpecEdgeCases:
         assert join.left.identifier == join.right.identifier
         assert join.left.alias != join.right.alias
 
+    def test_join_table_identifiers_interned(self):
+        """Test that equal join table identifiers share one string object."""
+        left = JoinTableRef(identifier=".".join(["cat", "sch", "employees"]))
+        right = JoinTableRef(identifier=".".join(["cat", "sch", "employees"]))
+        assert left.identifier is right.identifier
+
+    def test_join_table_refs_deduplicate_in_sets(self):
+        """Test that frozen join table refs hash by value."""
+        refs = {
+            JoinTableRef(identifier="cat.sch.employees", alias="e"),
+            JoinTableRef(identifier="cat.sch.employees", alias="e"),
+            JoinTableRef(identifier="cat.sch.employees", alias="m"),
+        }
+        assert len(refs) == 2
+
 
 class TestSqlSnippetEdgeCases:
     """Edge case tests for SqlSnippet."""
@@ -728,48 +756,90 @@ class TestSpaceConfigEdgeCases:
         assert space.data_sources.tables[0].identifier == "cat.sch.tbl"
 
 
+class TestEmptyListEdgeCases:
+    """Empty list fields are accepted and kept as empty lists."""
+
+    @pytest.mark.parametrize(
+        "model,kwargs,field",
+        [
+            (ColumnConfig, {"column_name": "test", "description": []}, "description"),
+            (SampleQuestion, {"question": []}, "question"),
+            (TextInstruction, {"content": []}, "content"),
+            (
+                ParameterConfig,
+                {"name": "test", "type_hint": "STRING", "description": []},
+                "description",
+            ),
+        ],
+        ids=["column-description", "sample-question", "text-content", "parameter-description"],
+    )
+    def test_empty_list_kept(self, model, kwargs, field):
+        """Test that an explicitly empty list stays empty."""
+        instance = model(**kwargs)
+        assert getattr(instance, field) == []
+
+
 class TestBackwardCompatibilityEdgeCases:
     """Tests for backward compatibility with old API formats."""
 
-    def test_column_config_old_string_description(self):
-        """Test ColumnConfig handles old string description format."""
-        col = ColumnConfig(column_name="test", description="Old format")
-        assert isinstance(col.description, list)
-        assert col.description == ["Old format"]
-
-    def test_sample_question_old_string_format(self):
-        """Test SampleQuestion handles old string format."""
-        sq = SampleQuestion(question="Old string question")
-        assert isinstance(sq.question, list)
-        assert sq.question == ["Old string question"]
-
-    def test_text_instruction_old_string_content(self):
-        """Test TextInstruction handles old string content."""
-        ti = TextInstruction(content="Old string content")
-        assert isinstance(ti.content, list)
-        assert ti.content == ["Old string content"]
-
-    def test_example_sql_old_string_question(self):
-        """Test ExampleQuestionSQL handles old string question."""
-        eq = ExampleQuestionSQL(question="Old question", sql=["SELECT 1"])
-        assert isinstance(eq.question, list)
-        assert eq.question == ["Old question"]
-
-    def test_example_sql_old_string_sql(self):
-        """Test ExampleQuestionSQL handles old string sql."""
-        eq = ExampleQuestionSQL(question=["Q?"], sql="SELECT 1")
-        assert isinstance(eq.sql, list)
-        assert eq.sql == ["SELECT 1"]
-
-    def test_join_spec_sql_string_normalized(self):
-        """Test JoinSpec handles string sql (normalized to list)."""
-        join = JoinSpec(
-            left=JoinTableRef(identifier="a"),
-            right=JoinTableRef(identifier="b"),
-            sql="a.id = b.id",
-        )
-        assert isinstance(join.sql, list)
-        assert join.sql == ["a.id = b.id"]
+    @pytest.mark.parametrize(
+        "model,kwargs,field,expected",
+        [
+            (
+                ColumnConfig,
+                {"column_name": "test", "description": "Old format"},
+                "description",
+                ["Old format"],
+            ),
+            (
+                SampleQuestion,
+                {"question": "Old string question"},
+                "question",
+                ["Old string question"],
+            ),
+            (
+                TextInstruction,
+                {"content": "Old string content"},
+                "content",
+                ["Old string content"],
+            ),
+            (
+                ExampleQuestionSQL,
+                {"question": "Old question", "sql": ["SELECT 1"]},
+                "question",
+                ["Old question"],
+            ),
+            (
+                ExampleQuestionSQL,
+                {"question": ["Q?"], "sql": "SELECT 1"},
+                "sql",
+                ["SELECT 1"],
+            ),
+            (
+                JoinSpec,
+                {
+                    "left": JoinTableRef(identifier="a"),
+                    "right": JoinTableRef(identifier="b"),
+                    "sql": "a.id = b.id",
+                },
+                "sql",
+                ["a.id = b.id"],
+            ),
+        ],
+        ids=[
+            "column-description",
+            "sample-question",
+            "text-content",
+            "example-question",
+            "example-sql",
+            "join-sql",
+        ],
+    )
+    def test_old_string_format_normalized(self, model, kwargs, field, expected):
+        """Test that an old single-string value is normalized to a list."""
+        value = getattr(model(**kwargs), field)
+        assert isinstance(value, list)
+        assert value == expected
 
 
 class TestValidationEdgeCases:
@@ -790,6 +860,13 @@ class TestValidationEdgeCases:
         with pytest.raises(ValidationError):
             SpaceConfig(title="Test", warehouse_id="wh")
 
+    def test_space_config_missing_required(self):
+        """Test the structural pre-check lists absent required fields in order."""
+        assert SpaceConfig.missing_required({"title": "Test"}) == ["space_id", "warehouse_id"]
+        assert (
+            SpaceConfig.missing_required({"space_id": "s", "title": "T", "warehouse_id": "w"}) == []
+        )
+
     def test_join_table_ref_requires_identifier(self):
         """Test that JoinTableRef requires identifier."""
         with pytest.raises(ValidationError):
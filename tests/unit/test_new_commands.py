@@ -3,65 +3,134 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
 
+import pytest
 from click.testing import CliRunner
 
 from genie_forge.cli import main
 
+# Read-only results for check_demo_objects_exist, shared by the demo-status tests
+DEMO_STATUS_MIXED = MappingProxyType(
+    {
+        "existing_tables": ("cat.sch.employees",),
+        "missing_tables": ("cat.sch.sales",),
+        "existing_functions": (),
+        "missing_functions": ("cat.sch.func1",),
+        "total_existing": 1,
+        "total_missing": 2,
+    }
+)
+DEMO_STATUS_EMPTY = MappingProxyType(
+    {
+        "existing_tables": (),
+        "missing_tables": (),
+        "existing_functions": (),
+        "missing_functions": (),
+        "total_existing": 0,
+        "total_missing": 0,
+    }
+)
+
+
+# Key commands that must appear in the top-level help
+EXPECTED_COMMANDS = frozenset(
+    {
+        "init",
+        "profiles",
+        "whoami",
+        "validate",
+        "plan",
+        "apply",
+        "destroy",
+        "status",
+        "drift",
+        "find",
+        "space-list",
+        "space-get",
+        "space-create",
+        "state-list",
+        "state-show",
+    }
+)
+# First word of each entry in Click's "Commands:" listing
+COMMAND_NAME_RE = re.compile(r"^\s+(\S+)", re.MULTILINE)
+
+
+@pytest.fixture(scope="module")
+def space_yaml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Minimal space config file, written once and only read by tests."""
+    path = tmp_path_factory.mktemp("new_commands") / "space.yaml"
+    path.write_text(
+        """
+title: Test Space
+warehouse_id: wh123
+data_sources:
+  tables:
+    - identifier: cat.sch.table
+"""
+    )
+    return path
+
 
 class TestInitCommand:
     """Tests for init command."""
 
-    def test_init_help(self):
+    @pytest.fixture
+    def project_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Fresh, empty working directory for an init run."""
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    @pytest.fixture
+    def initialized_project(self, runner: CliRunner, project_dir: Path) -> Path:
+        """Working directory that has already been through ``init --yes``."""
+        result = runner.invoke(main, ["init", "--yes"])
+        assert result.exit_code == 0
+        return project_dir
+
+    def test_init_help(self, help_output):
         """Test init command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["init", "--help"])
+        result = help_output("init")
 
         assert result.exit_code == 0
         assert "--path" in result.output
         assert "--force" in result.output
         assert "--minimal" in result.output
 
-    def test_init_creates_structure(self, tmp_path):
+    def test_init_creates_structure(self, runner, project_dir):
         """Test init creates correct directory structure."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(main, ["init", "--yes"])
+        result = runner.invoke(main, ["init", "--yes"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Check directories created
-            assert Path("conf/spaces").exists()
-            assert Path("conf/variables").exists()
+        # Check directories created
+        assert Path("conf/spaces").exists()
+        assert Path("conf/variables").exists()
 
-            # Check state file created
-            assert Path(".genie-forge.json").exists()
+        # Check state file created
+        assert Path(".genie-forge.json").exists()
 
-            # Check example files created
-            assert Path("conf/spaces/example.yaml").exists()
-            assert Path("conf/variables/env.yaml").exists()
+        # Check example files created
+        assert Path("conf/spaces/example.yaml").exists()
+        assert Path("conf/variables/env.yaml").exists()
 
-    def test_init_minimal(self, tmp_path):
+    def test_init_minimal(self, runner, project_dir):
         """Test init with --minimal flag."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(main, ["init", "--yes", "--minimal"])
+        result = runner.invoke(main, ["init", "--yes", "--minimal"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            # Check directories created
-            assert Path("conf/spaces").exists()
+        # Check directories created
+        assert Path("conf/spaces").exists()
 
-            # Check example files NOT created
-            assert not Path("conf/spaces/example.yaml").exists()
+        # Check example files NOT created
+        assert not Path("conf/spaces/example.yaml").exists()
 
-    def test_init_custom_path(self, tmp_path):
+    def test_init_custom_path(self, runner, tmp_path):
         """Test init with custom path."""
-        runner = CliRunner()
         custom_path = tmp_path / "my-project"
 
         result = runner.invoke(main, ["init", "--path", str(custom_path), "--yes"])
@@ -70,75 +139,55 @@ class TestInitCommand:
         assert (custom_path / "conf" / "spaces").exists()
         assert (custom_path / ".genie-forge.json").exists()
 
-    def test_init_already_exists(self, tmp_path):
+    def test_init_already_exists(self, runner, initialized_project):
         """Test init when project already exists."""
-        runner = CliRunner()
+        # Second init without force
+        result = runner.invoke(main, ["init", "--yes"])
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # First init
-            runner.invoke(main, ["init", "--yes"])
-
-            # Second init without force
-            result = runner.invoke(main, ["init", "--yes"])
-
-            # Should still succeed (with warning)
-            assert result.exit_code == 0
+        # Should still succeed (with warning)
+        assert result.exit_code == 0
 
-    def test_init_force_overwrite(self, tmp_path):
+    def test_init_force_overwrite(self, runner, initialized_project):
         """Test init with --force overwrites existing files."""
-        runner = CliRunner()
+        # Modify a file
+        example_file = Path("conf/spaces/example.yaml")
+        example_file.write_text("modified content")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # First init
-            runner.invoke(main, ["init", "--yes"])
+        # Second init with force
+        result = runner.invoke(main, ["init", "--yes", "--force"])
 
-            # Modify a file
-            example_file = Path("conf/spaces/example.yaml")
-            example_file.write_text("modified content")
-
-            # Second init with force
-            result = runner.invoke(main, ["init", "--yes", "--force"])
-
-            assert result.exit_code == 0
-            # File should be overwritten
-            assert example_file.read_text() != "modified content"
+        assert result.exit_code == 0
+        # File should be overwritten
+        assert example_file.read_text() != "modified content"
 
-    def test_init_state_file_valid_json(self, tmp_path):
+    def test_init_state_file_valid_json(self, initialized_project):
         """Test that created state file is valid JSON."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            runner.invoke(main, ["init", "--yes"])
-
-            state_file = Path(".genie-forge.json")
-            content = state_file.read_text()
-            data = json.loads(content)
+        state_file = Path(".genie-forge.json")
+        content = state_file.read_text()
+        data = json.loads(content)
 
-            assert "version" in data
-            assert "environments" in data
+        assert "version" in data
+        assert "environments" in data
 
-    def test_init_updates_gitignore(self, tmp_path):
+    def test_init_updates_gitignore(self, runner, project_dir):
         """Test init updates .gitignore."""
-        runner = CliRunner()
+        # Create existing .gitignore
+        Path(".gitignore").write_text("*.pyc\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create existing .gitignore
-            Path(".gitignore").write_text("*.pyc\n")
+        runner.invoke(main, ["init", "--yes"])
 
-            runner.invoke(main, ["init", "--yes"])
-
-            gitignore = Path(".gitignore").read_text()
-            assert "*.pyc" in gitignore  # Original content preserved
-            assert ".genie-forge.json" in gitignore  # New content added
+        gitignore = Path(".gitignore").read_text()
+        # Original content preserved, new content added
+        missing = [entry for entry in ("*.pyc", ".genie-forge.json") if entry not in gitignore]
+        assert not missing, f".gitignore is missing: {missing}"
 
 
 class TestWhoamiCommand:
     """Tests for whoami command."""
 
-    def test_whoami_help(self):
+    def test_whoami_help(self, help_output):
         """Test whoami command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["whoami", "--help"])
+        result = help_output("whoami")
 
         assert result.exit_code == 0
         assert "--profile" in result.output
@@ -152,41 +201,33 @@ class TestWhoamiCommand:
 class TestDemoStatusCommand:
     """Tests for demo-status command."""
 
-    def test_demo_status_help(self):
+    def test_demo_status_help(self, help_output):
         """Test demo-status command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["demo-status", "--help"])
+        result = help_output("demo-status")
 
         assert result.exit_code == 0
         assert "--catalog" in result.output
         assert "--schema" in result.output
         assert "--warehouse-id" in result.output
 
-    def test_demo_status_requires_options(self):
+    def test_demo_status_requires_options(self, runner):
         """Test demo-status requires required options."""
-        runner = CliRunner()
         result = runner.invoke(main, ["demo-status"])
 
         assert result.exit_code != 0
         # Should complain about missing required options
 
-    @patch("genie_forge.demo_tables.check_demo_objects_exist")
-    @patch("genie_forge.cli.demo.get_genie_client")
-    def test_demo_status_shows_status(self, mock_get_client, mock_check):
+    def test_demo_status_shows_status(self, monkeypatch, runner):
         """Test demo-status shows object status."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_check.return_value = {
-            "existing_tables": ["cat.sch.employees"],
-            "missing_tables": ["cat.sch.sales"],
-            "existing_functions": [],
-            "missing_functions": ["cat.sch.func1"],
-            "total_existing": 1,
-            "total_missing": 2,
-        }
+        # No client methods are called here, so any object will do
+        monkeypatch.setattr(
+            "genie_forge.cli.demo.get_genie_client", lambda *args, **kwargs: SimpleNamespace()
+        )
+        monkeypatch.setattr(
+            "genie_forge.demo_tables.check_demo_objects_exist",
+            lambda *args, **kwargs: DEMO_STATUS_MIXED,
+        )
 
-        runner = CliRunner()
         result = runner.invoke(
             main,
             [
@@ -202,23 +243,17 @@ class TestDemoStatusCommand:
 
         assert result.exit_code == 0
 
-    @patch("genie_forge.demo_tables.check_demo_objects_exist")
-    @patch("genie_forge.cli.demo.get_genie_client")
-    def test_demo_status_json_output(self, mock_get_client, mock_check):
+    def test_demo_status_json_output(self, monkeypatch, runner):
         """Test demo-status with JSON output."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        mock_check.return_value = {
-            "existing_tables": [],
-            "missing_tables": [],
-            "existing_functions": [],
-            "missing_functions": [],
-            "total_existing": 0,
-            "total_missing": 0,
-        }
+        # No client methods are called here, so any object will do
+        monkeypatch.setattr(
+            "genie_forge.cli.demo.get_genie_client", lambda *args, **kwargs: SimpleNamespace()
+        )
+        monkeypatch.setattr(
+            "genie_forge.demo_tables.check_demo_objects_exist",
+            lambda *args, **kwargs: DEMO_STATUS_EMPTY,
+        )
 
-        runner = CliRunner()
         result = runner.invoke(
             main,
             [
@@ -242,27 +277,29 @@ class TestDemoStatusCommand:
 class TestSpaceListCommand:
     """Tests for space-list command."""
 
-    def test_space_list_help(self):
+    def test_space_list_help(self, help_output):
         """Test space-list command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["space-list", "--help"])
+        result = help_output("space-list")
 
         assert result.exit_code == 0
         assert "--profile" in result.output
         assert "--limit" in result.output
 
-    @patch("genie_forge.cli.space_cmd.get_genie_client")
-    @patch("genie_forge.cli.space_cmd.fetch_all_spaces_paginated")
-    def test_space_list_displays_spaces(self, mock_fetch, mock_get_client):
+    def test_space_list_displays_spaces(self, monkeypatch, runner):
         """Test space-list displays spaces."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_fetch.return_value = [
+        # No client methods are called here, so any object will do
+        monkeypatch.setattr(
+            "genie_forge.cli.space_cmd.get_genie_client", lambda *args, **kwargs: SimpleNamespace()
+        )
+        spaces = [
             {"id": "space1", "title": "Space 1", "warehouse_id": "wh1", "creator": "user1"},
             {"id": "space2", "title": "Space 2", "warehouse_id": "wh2", "creator": "user2"},
         ]
+        monkeypatch.setattr(
+            "genie_forge.cli.space_cmd.fetch_all_spaces_paginated",
+            lambda *args, **kwargs: spaces,
+        )
 
-        runner = CliRunner()
         result = runner.invoke(main, ["space-list", "--profile", "TEST"])
 
         assert result.exit_code == 0
@@ -272,18 +309,16 @@ class TestSpaceListCommand:
 class TestSpaceGetCommand:
     """Tests for space-get command."""
 
-    def test_space_get_help(self):
+    def test_space_get_help(self, help_output):
         """Test space-get command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["space-get", "--help"])
+        result = help_output("space-get")
 
         assert result.exit_code == 0
         assert "--name" in result.output
         assert "--raw" in result.output
 
-    def test_space_get_requires_id_or_name(self):
+    def test_space_get_requires_id_or_name(self, runner):
         """Test space-get requires either ID or --name."""
-        runner = CliRunner()
         result = runner.invoke(main, ["space-get", "--profile", "TEST"])
 
         assert result.exit_code != 0
@@ -292,17 +327,15 @@ class TestSpaceGetCommand:
 class TestSpaceFindCommand:
     """Tests for space-find command."""
 
-    def test_space_find_help(self):
+    def test_space_find_help(self, help_output):
         """Test space-find command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["space-find", "--help"])
+        result = help_output("space-find")
 
         assert result.exit_code == 0
         assert "--name" in result.output
 
-    def test_space_find_requires_name(self):
+    def test_space_find_requires_name(self, runner):
         """Test space-find requires --name."""
-        runner = CliRunner()
         result = runner.invoke(main, ["space-find"])
 
         assert result.exit_code != 0
@@ -311,10 +344,9 @@ class TestSpaceFindCommand:
 class TestSpaceCreateCommand:
     """Tests for space-create command."""
 
-    def test_space_create_help(self):
+    def test_space_create_help(self, help_output):
         """Test space-create command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["space-create", "--help"])
+        result = help_output("space-create")
 
         assert result.exit_code == 0
         assert "--from-file" in result.output
@@ -322,42 +354,28 @@ class TestSpaceCreateCommand:
         assert "--tables" in result.output
         assert "--set" in result.output
 
-    def test_space_create_requires_title_or_file(self):
+    def test_space_create_requires_title_or_file(self, runner):
         """Test space-create requires title or --from-file."""
-        runner = CliRunner()
         result = runner.invoke(main, ["space-create", "--profile", "TEST"])
 
         assert result.exit_code != 0
 
-    def test_space_create_requires_warehouse_without_file(self):
+    def test_space_create_requires_warehouse_without_file(self, runner):
         """Test space-create requires --warehouse-id when not using --from-file."""
-        runner = CliRunner()
         result = runner.invoke(main, ["space-create", "Test Space", "--profile", "TEST"])
 
         assert result.exit_code != 0
 
-    @patch("genie_forge.cli.space_cmd.get_genie_client")
-    def test_space_create_dry_run(self, mock_get_client, tmp_path):
+    def test_space_create_dry_run(self, monkeypatch, space_yaml, runner):
         """Test space-create with --dry-run."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-
-        # Create a config file
-        config_file = tmp_path / "space.yaml"
-        config_file.write_text(
-            """
-title: Test Space
-warehouse_id: wh123
-data_sources:
-  tables:
-    - identifier: cat.sch.table
-"""
+        # No client methods are called here, so any object will do
+        monkeypatch.setattr(
+            "genie_forge.cli.space_cmd.get_genie_client", lambda *args, **kwargs: SimpleNamespace()
         )
 
-        runner = CliRunner()
         result = runner.invoke(
             main,
-            ["space-create", "--from-file", str(config_file), "--dry-run", "--profile", "TEST"],
+            ["space-create", "--from-file", str(space_yaml), "--dry-run", "--profile", "TEST"],
         )
 
         assert result.exit_code == 0
@@ -367,10 +385,9 @@ data_sources:
 class TestSpaceExportCommand:
     """Tests for space-export command."""
 
-    def test_space_export_help(self):
+    def test_space_export_help(self, help_output):
         """Test space-export command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["space-export", "--help"])
+        result = help_output("space-export")
 
         assert result.exit_code == 0
         assert "--output-dir" in result.output
@@ -381,19 +398,17 @@ class TestSpaceExportCommand:
 class TestSpaceCloneCommand:
     """Tests for space-clone command."""
 
-    def test_space_clone_help(self):
+    def test_space_clone_help(self, help_output):
         """Test space-clone command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["space-clone", "--help"])
+        result = help_output("space-clone")
 
         assert result.exit_code == 0
         assert "--name" in result.output
         assert "--to-workspace" in result.output
         assert "--to-file" in result.output
 
-    def test_space_clone_requires_destination(self):
+    def test_space_clone_requires_destination(self, runner):
         """Test space-clone requires --to-workspace or --to-file."""
-        runner = CliRunner()
         result = runner.invoke(
             main, ["space-clone", "space123", "--name", "Clone", "--profile", "TEST"]
         )
@@ -404,60 +419,56 @@ class TestSpaceCloneCommand:
 class TestStateListCommand:
     """Tests for state-list command."""
 
-    def test_state_list_help(self):
+    def test_state_list_help(self, help_output):
         """Test state-list command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["state-list", "--help"])
+        result = help_output("state-list")
 
         assert result.exit_code == 0
         assert "--env" in result.output
         assert "--state-file" in result.output
 
-    def test_state_list_no_state_file(self, tmp_path):
+    def test_state_list_no_state_file(self, runner, tmp_path, monkeypatch):
         """Test state-list when no state file exists."""
-        runner = CliRunner()
+        monkeypatch.chdir(tmp_path)
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(main, ["state-list"])
+        result = runner.invoke(main, ["state-list"])
 
-            # Should handle gracefully
-            assert result.exit_code == 0
-            assert "not found" in result.output.lower() or "no spaces" in result.output.lower()
+        # Should handle gracefully
+        assert result.exit_code == 0
+        assert "not found" in result.output.lower() or "no spaces" in result.output.lower()
 
-    def test_state_list_with_state(self, tmp_path):
+    def test_state_list_with_state(self, runner, tmp_path, monkeypatch):
         """Test state-list with existing state."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create state file
-            state_data = {
-                "version": "1.0",
-                "environments": {
-                    "dev": {
-                        "spaces": {
-                            "space1": {
-                                "logical_id": "space1",
-                                "databricks_space_id": "db123",
-                                "title": "Space 1",
-                            }
+        monkeypatch.chdir(tmp_path)
+
+        # Create state file
+        state_data = {
+            "version": "1.0",
+            "environments": {
+                "dev": {
+                    "spaces": {
+                        "space1": {
+                            "logical_id": "space1",
+                            "databricks_space_id": "db123",
+                            "title": "Space 1",
                         }
                     }
-                },
-            }
-            Path(".genie-forge.json").write_text(json.dumps(state_data))
+                }
+            },
+        }
+        Path(".genie-forge.json").write_text(json.dumps(state_data))
 
-            result = runner.invoke(main, ["state-list"])
+        result = runner.invoke(main, ["state-list"])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
 
 class TestStateShowCommand:
     """Tests for state-show command."""
 
-    def test_state_show_help(self):
+    def test_state_show_help(self, help_output):
         """Test state-show command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["state-show", "--help"])
+        result = help_output("state-show")
 
         assert result.exit_code == 0
         assert "--env" in result.output
@@ -467,18 +478,16 @@ class TestStateShowCommand:
 class TestStatePullCommand:
     """Tests for state-pull command."""
 
-    def test_state_pull_help(self):
+    def test_state_pull_help(self, help_output):
         """Test state-pull command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["state-pull", "--help"])
+        result = help_output("state-pull")
 
         assert result.exit_code == 0
         assert "--env" in result.output
         assert "--verify-only" in result.output
 
-    def test_state_pull_requires_env(self):
+    def test_state_pull_requires_env(self, runner):
         """Test state-pull requires --env."""
-        runner = CliRunner()
         result = runner.invoke(main, ["state-pull"])
 
         assert result.exit_code != 0
@@ -487,18 +496,16 @@ class TestStatePullCommand:
 class TestStateRemoveCommand:
     """Tests for state-remove command."""
 
-    def test_state_remove_help(self):
+    def test_state_remove_help(self, help_output):
         """Test state-remove command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["state-remove", "--help"])
+        result = help_output("state-remove")
 
         assert result.exit_code == 0
         assert "--env" in result.output
         assert "--force" in result.output
 
-    def test_state_remove_requires_env(self):
+    def test_state_remove_requires_env(self, runner):
         """Test state-remove requires --env."""
-        runner = CliRunner()
         result = runner.invoke(main, ["state-remove", "space1"])
 
         assert result.exit_code != 0
@@ -507,10 +514,9 @@ class TestStateRemoveCommand:
 class TestStateImportCommand:
     """Tests for state-import command."""
 
-    def test_state_import_help(self):
+    def test_state_import_help(self, help_output):
         """Test state-import command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["state-import", "--help"])
+        result = help_output("state-import")
 
         assert result.exit_code == 0
         assert "--pattern" in result.output
@@ -520,10 +526,9 @@ class TestStateImportCommand:
 class TestDriftCommand:
     """Tests for drift command."""
 
-    def test_drift_help(self):
+    def test_drift_help(self, help_output):
         """Test drift command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["drift", "--help"])
+        result = help_output("drift")
 
         assert result.exit_code == 0
         assert "--env" in result.output
@@ -533,39 +538,20 @@ class TestDriftCommand:
 class TestCommandOrdering:
     """Tests for CLI command ordering."""
 
-    def test_commands_available(self):
-        """Test that all key commands are available in help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
-
-        output = result.output
-
-        # All key commands should be present in help
-        expected_commands = [
-            "init",
-            "profiles",
-            "whoami",
-            "validate",
-            "plan",
-            "apply",
-            "destroy",
-            "status",
-            "drift",
-            "find",
-            "space-list",
-            "space-get",
-            "space-create",
-            "state-list",
-            "state-show",
-        ]
+    def test_commands_available(self, help_output):
+        """Test that all key commands are listed in the Commands section of help."""
+        result = help_output()
+
+        assert result.exit_code == 0
+        _, _, commands_section = result.output.partition("Commands:")
+        listed = set(COMMAND_NAME_RE.findall(commands_section))
 
-        for cmd in expected_commands:
-            assert cmd in output, f"Command '{cmd}' not found in help output"
+        missing = sorted(EXPECTED_COMMANDS - listed)
+        assert not missing, f"Commands not found in help output: {missing}"
 
-    def test_help_has_sections(self):
+    def test_help_has_sections(self, help_output):
         """Test that help output has organized sections."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        result = help_output()
 
         # Help should show some commands (specific section names may vary)
         assert "Commands:" in result.output or "CORE" in result.output
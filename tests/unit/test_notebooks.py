@@ -7,17 +7,111 @@ Tests that:
 """
 
 import ast
+import functools
+import importlib.util
 import re
 from pathlib import Path
 
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
 # Path to notebooks directory
 NOTEBOOKS_DIR = Path(__file__).parent.parent.parent / "notebooks"
 
-# All notebook files
-NOTEBOOK_FILES = list(NOTEBOOKS_DIR.glob("*.py"))
+# All notebook files, sorted so every pytest-xdist worker collects the same order
+NOTEBOOK_FILES = sorted(NOTEBOOKS_DIR.glob("*.py"))
+
+# genie_forge import statements
+IMPORT_RE = re.compile(
+    r"^[ \t]*(?:from\s+(genie_forge[\w.]*)\s+import|import\s+(genie_forge[\w.]*))",
+    re.MULTILINE,
+)
+# Multi-line string assignments that may hold YAML configs, e.g. config = """..."""
+YAML_BLOCK_RE = re.compile(r'(\w+)\s*=\s*"""(.*?)"""', re.DOTALL)
+# ${var} placeholders inside YAML examples
+VAR_PLACEHOLDER_RE = re.compile(r"\$\{[^}]+\}")
+# Databricks magic lines that are not valid Python
+MAGIC_LINE_RE = re.compile(r"^([ \t]*(?:# MAGIC|%pip|%sql).*)$", re.MULTILINE)
+# Time estimate such as "Time: ~10 minutes"
+TIME_ESTIMATE_RE = re.compile(r"Time:\s*~?\d+\s*minutes?", re.IGNORECASE)
+
+# Dict keys that mark a literal as a space configuration
+SPACE_CONFIG_KEYS = frozenset({"version", "space_id", "title", "warehouse_id"})
+
+# Elements each advanced pattern's example must contain in 05_Advanced_Patterns.py
+ADVANCED_CHECKS = [
+    (
+        "self_join",
+        ("self_join_config", '"version": 2', '"space_id"', '"join_specs"', "manager_id"),
+    ),
+    (
+        "parameterized",
+        (
+            "parameterized_config",
+            '"parameters"',
+            '"type_hint"',
+            '"default_value"',
+            ":region_filter",
+        ),
+    ),
+    ("benchmark", ("benchmark_config", '"benchmarks"', '"expected_sql"')),
+    (
+        "relationship_type",
+        (
+            "--rt=FROM_RELATIONSHIP_TYPE_MANY_TO_ONE--",
+            "FROM_RELATIONSHIP_TYPE_ONE_TO_ONE",
+            "FROM_RELATIONSHIP_TYPE_MANY_TO_MANY",
+        ),
+    ),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _read_notebook(path: Path) -> str:
+    """Read a notebook once per session; several tests inspect the same file."""
+    return path.read_text()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_notebook_folded(path: Path) -> str:
+    """Case-folded notebook text, for case-insensitive checks."""
+    return _read_notebook(path).casefold()
+
+
+@functools.lru_cache(maxsize=None)
+def _is_resolvable(module_name: str) -> bool:
+    """Check that a module can be found, without executing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def _strip_magic(content: str) -> str:
+    """Comment out Databricks magic lines so the notebook parses as Python.
+
+    These include:
+    - # MAGIC %md (markdown)
+    - %pip install (pip magic)
+    - %sql (SQL magic)
+    """
+    return MAGIC_LINE_RE.sub(r"# \1", content)
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed_notebook_ast(path: Path) -> ast.Module:
+    """Parse a notebook (magic lines commented out) once per session."""
+    return ast.parse(_strip_magic(_read_notebook(path)))
+
+
+def _missing_substrings(folded_text: str, needles: list[str]) -> list[str]:
+    """Return the needles that do not occur, ignoring case, in case-folded text."""
+    return [needle for needle in needles if needle.casefold() not in folded_text]
 
 
 class TestNotebookSyntax:
@@ -26,36 +120,16 @@ class TestNotebookSyntax:
     @pytest.mark.parametrize("notebook_path", NOTEBOOK_FILES, ids=lambda p: p.name)
     def test_notebook_parses_as_valid_python(self, notebook_path: Path):
         """Each notebook should be valid Python syntax."""
-        content = notebook_path.read_text()
-
-        # Remove Databricks magic commands for syntax checking
-        # These include:
-        # - # MAGIC %md (markdown)
-        # - %pip install (pip magic)
-        # - %sql (SQL magic)
-        lines = []
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith("# MAGIC"):
-                # Convert magic to a comment that Python can parse
-                lines.append("# " + line)
-            elif stripped.startswith("%pip") or stripped.startswith("%sql"):
-                # Convert cell magic to a comment
-                lines.append("# " + line)
-            else:
-                lines.append(line)
-
-        cleaned_content = "\n".join(lines)
-
         try:
-            ast.parse(cleaned_content)
+            # compile() checks syntax without building Python-level AST nodes
+            compile(_strip_magic(_read_notebook(notebook_path)), str(notebook_path), "exec")
         except SyntaxError as e:
             pytest.fail(f"Notebook {notebook_path.name} has syntax error: {e}")
 
     @pytest.mark.parametrize("notebook_path", NOTEBOOK_FILES, ids=lambda p: p.name)
     def test_notebook_has_command_separators(self, notebook_path: Path):
         """Each notebook should have Databricks command separators."""
-        content = notebook_path.read_text()
+        content = _read_notebook(notebook_path)
 
         # Check for command separators
         assert "# COMMAND ----------" in content, (
@@ -69,27 +143,14 @@ class TestNotebookImports:
     @pytest.mark.parametrize("notebook_path", NOTEBOOK_FILES, ids=lambda p: p.name)
     def test_genie_forge_imports_are_valid(self, notebook_path: Path):
         """All genie_forge imports in notebooks should be resolvable."""
-        content = notebook_path.read_text()
-
-        # Find all import statements
-        import_pattern = r"^(?:from\s+(genie_forge[\w.]*)\s+import|import\s+(genie_forge[\w.]*))"
-
-        for line in content.split("\n"):
-            line = line.strip()
-            # Skip magic commands and comments
-            if line.startswith("#"):
-                continue
+        content = _read_notebook(notebook_path)
 
-            match = re.match(import_pattern, line)
-            if match:
-                module_name = match.group(1) or match.group(2)
-                try:
-                    # Try to import the module
-                    __import__(module_name)
-                except ImportError as e:
-                    pytest.fail(
-                        f"Notebook {notebook_path.name} has invalid import: '{module_name}' - {e}"
-                    )
+        # Commented-out and magic lines start with "#", so IMPORT_RE skips them
+        module_names = {match.group(1) or match.group(2) for match in IMPORT_RE.finditer(content)}
+        unresolvable = sorted(name for name in module_names if not _is_resolvable(name))
+        assert not unresolvable, (
+            f"Notebook {notebook_path.name} has invalid imports: {unresolvable}"
+        )
 
 
 class TestNotebookExamples:
@@ -102,11 +163,11 @@ class TestNotebookExamples:
         """
         configs = []
 
-        # Pattern for multi-line string assignments that look like YAML configs
-        # e.g., config_with_variables = """
-        pattern = r'(\w+)\s*=\s*"""(.*?)"""'
+        # No block can look like a config if the notebook never mentions the keys
+        if "version:" not in content and "space_id:" not in content:
+            return configs
 
-        for match in re.finditer(pattern, content, re.DOTALL):
+        for match in YAML_BLOCK_RE.finditer(content):
             var_name = match.group(1)
             yaml_content = match.group(2).strip()
 
@@ -116,8 +177,8 @@ class TestNotebookExamples:
 
         return configs
 
-    def _extract_dict_configs(self, content: str) -> list[tuple[str, dict]]:
-        """Extract Python dict configurations from notebook content.
+    def _extract_dict_configs(self, notebook_path: Path) -> list[tuple[str, dict]]:
+        """Extract Python dict configurations from a notebook.
 
         Returns list of (config_name, dict) tuples.
         """
@@ -125,15 +186,7 @@ class TestNotebookExamples:
 
         # Parse the AST to find dict assignments
         try:
-            # Clean content for parsing
-            lines = []
-            for line in content.split("\n"):
-                if line.strip().startswith("# MAGIC"):
-                    lines.append("# " + line)
-                else:
-                    lines.append(line)
-
-            tree = ast.parse("\n".join(lines))
+            tree = _parsed_notebook_ast(notebook_path)
         except SyntaxError:
             return configs
 
@@ -152,79 +205,49 @@ class TestNotebookExamples:
                         try:
                             # We can't easily eval complex dicts with string interpolation
                             # So we check structure instead
-                            keys = []
-                            for key in node.value.keys:
-                                if isinstance(key, ast.Constant):
-                                    keys.append(key.value)
+                            keys = [
+                                key.value
+                                for key in node.value.keys
+                                if isinstance(key, ast.Constant)
+                            ]
 
                             # If it has space config keys, record it
-                            if any(
-                                k in keys for k in ["version", "space_id", "title", "warehouse_id"]
-                            ):
+                            if not SPACE_CONFIG_KEYS.isdisjoint(keys):
                                 configs.append((var_name, {"_keys": keys}))
                         except Exception:
                             pass
 
         return configs
 
-    def test_05_advanced_self_join_config_structure(self):
-        """Test that self_join_config in 05_Advanced has required fields."""
-        notebook_path = NOTEBOOKS_DIR / "05_Advanced_Patterns.py"
-        content = notebook_path.read_text()
-
-        # Check that self_join_config exists and has key elements
-        assert "self_join_config" in content
-        assert '"version": 2' in content or "'version': 2" in content
-        assert '"space_id"' in content or "'space_id'" in content
-        assert '"join_specs"' in content or "'join_specs'" in content
-        assert "manager_id" in content  # Self-join indicator
-
-    def test_05_advanced_parameterized_config_structure(self):
-        """Test that parameterized_config in 05_Advanced has required fields."""
-        notebook_path = NOTEBOOKS_DIR / "05_Advanced_Patterns.py"
-        content = notebook_path.read_text()
-
-        # Check for parameterized query elements
-        assert "parameterized_config" in content
-        assert '"parameters"' in content or "'parameters'" in content
-        assert '"type_hint"' in content or "'type_hint'" in content
-        assert '"default_value"' in content or "'default_value'" in content
-        assert ":region_filter" in content  # Parameter placeholder
-
-    def test_05_advanced_benchmark_config_structure(self):
-        """Test that benchmark_config in 05_Advanced has required fields."""
-        notebook_path = NOTEBOOKS_DIR / "05_Advanced_Patterns.py"
-        content = notebook_path.read_text()
-
-        # Check for benchmark elements
-        assert "benchmark_config" in content
-        assert '"benchmarks"' in content or "'benchmarks'" in content
-        assert '"expected_sql"' in content or "'expected_sql'" in content
-
-    def test_05_advanced_relationship_type_annotation(self):
-        """Test that relationship type annotations are present."""
-        notebook_path = NOTEBOOKS_DIR / "05_Advanced_Patterns.py"
-        content = notebook_path.read_text()
-
-        # Check for relationship type annotation
-        assert "--rt=FROM_RELATIONSHIP_TYPE_MANY_TO_ONE--" in content
-
-        # Check documentation of all relationship types
-        assert "FROM_RELATIONSHIP_TYPE_ONE_TO_ONE" in content
-        assert "FROM_RELATIONSHIP_TYPE_MANY_TO_MANY" in content
+    @pytest.mark.parametrize(
+        "needles",
+        [group for _, group in ADVANCED_CHECKS],
+        ids=[name for name, _ in ADVANCED_CHECKS],
+    )
+    def test_05_advanced_config_structure(self, needles: tuple[str, ...]):
+        """Configs in 05_Advanced should contain each pattern's key elements."""
+        content = _read_notebook(NOTEBOOKS_DIR / "05_Advanced_Patterns.py")
+
+        # Dict keys may be written with either quote style
+        missing = [
+            needle
+            for needle in needles
+            if needle not in content and needle.replace('"', "'") not in content
+        ]
+        assert not missing, f"05_Advanced_Patterns.py is missing: {missing}"
 
     @pytest.mark.parametrize("notebook_path", NOTEBOOK_FILES, ids=lambda p: p.name)
     def test_yaml_examples_are_valid_yaml(self, notebook_path: Path):
         """YAML strings in notebooks should be valid YAML syntax."""
-        content = notebook_path.read_text()
+        content = _read_notebook(notebook_path)
         configs = self._extract_yaml_configs(content)
 
         for var_name, yaml_content in configs:
             # Replace variable placeholders with dummy values for parsing
-            yaml_content = re.sub(r"\$\{[^}]+\}", "placeholder", yaml_content)
+            yaml_content = VAR_PLACEHOLDER_RE.sub("placeholder", yaml_content)
 
             try:
-                yaml.safe_load(yaml_content)
+                yaml.load(yaml_content, Loader=_YAMLLoader)
             except yaml.YAMLError as e:
                 pytest.fail(f"Invalid YAML in {notebook_path.name}, variable '{var_name}': {e}")
 
@@ -234,9 +257,6 @@ class TestNotebookContent:
 
     def test_05_advanced_covers_key_topics(self):
         """Notebook 05 should cover all advanced topics."""
-        notebook_path = NOTEBOOKS_DIR / "05_Advanced_Patterns.py"
-        content = notebook_path.read_text()
-
         required_topics = [
             "Programmatic API",
             "Self-Join",
@@ -248,15 +268,13 @@ class TestNotebookContent:
             "Bulk Operations",
         ]
 
-        for topic in required_topics:
-            assert topic.lower() in content.lower(), (
-                f"Notebook 05_Advanced_Patterns.py should cover '{topic}'"
-            )
+        folded = _read_notebook_folded(NOTEBOOKS_DIR / "05_Advanced_Patterns.py")
+        missing = _missing_substrings(folded, required_topics)
+        assert not missing, f"Notebook 05_Advanced_Patterns.py should cover {missing}"
 
     def test_05_advanced_has_summary_table(self):
         """Notebook 05 should have a summary table with all patterns."""
-        notebook_path = NOTEBOOKS_DIR / "05_Advanced_Patterns.py"
-        content = notebook_path.read_text()
+        content = _read_notebook(NOTEBOOKS_DIR / "05_Advanced_Patterns.py")
 
         # Check for summary section
         assert "## Summary" in content
@@ -270,27 +288,25 @@ class TestNotebookContent:
             "Benchmarks",
         ]
 
-        for pattern in summary_patterns:
-            assert pattern in content, f"Summary table should include '{pattern}'"
+        missing = [pattern for pattern in summary_patterns if pattern not in content]
+        assert not missing, f"Summary table should include {missing}"
 
-    def test_notebooks_have_time_estimates(self):
+    @pytest.mark.parametrize("notebook_path", NOTEBOOK_FILES, ids=lambda p: p.name)
+    def test_notebooks_have_time_estimates(self, notebook_path: Path):
         """Each notebook should have a time estimate."""
-        for notebook_path in NOTEBOOK_FILES:
-            content = notebook_path.read_text()
+        content = _read_notebook(notebook_path)
 
-            # Check for time estimate (e.g., "Time: ~10 minutes")
-            assert re.search(r"Time:\s*~?\d+\s*minutes?", content, re.IGNORECASE), (
-                f"Notebook {notebook_path.name} should have a time estimate"
-            )
+        assert TIME_ESTIMATE_RE.search(content), (
+            f"Notebook {notebook_path.name} should have a time estimate"
+        )
 
-    def test_notebooks_have_prerequisites(self):
+    @pytest.mark.parametrize(
+        "notebook_path",
+        [p for p in NOTEBOOK_FILES if p.name != "00_Setup_Prerequisites.py"],
+        ids=lambda p: p.name,
+    )
+    def test_notebooks_have_prerequisites(self, notebook_path: Path):
         """Each notebook (except 00) should list prerequisites."""
-        for notebook_path in NOTEBOOK_FILES:
-            if notebook_path.name == "00_Setup_Prerequisites.py":
-                continue
-
-            content = notebook_path.read_text()
-
-            assert "prerequisite" in content.lower(), (
-                f"Notebook {notebook_path.name} should list prerequisites"
-            )
+        assert "prerequisite" in _read_notebook_folded(notebook_path), (
+            f"Notebook {notebook_path.name} should list prerequisites"
+        )
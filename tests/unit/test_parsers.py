@@ -1,5 +1,7 @@
 """Unit tests for genie_forge.parsers."""
 
+import json
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -13,6 +15,11 @@ from genie_forge.parsers import (
     validate_config,
 )
 
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YAMLDumper  # type: ignore[assignment]
+
 
 class TestVariableResolver:
     """Tests for VariableResolver."""
@@ -63,6 +70,23 @@ class TestVariableResolver:
         assert resolver.resolve(True) is True
         assert resolver.resolve(None) is None
 
+    def test_dict_subclass_resolved(self):
+        """Test that dict subclasses are still resolved recursively."""
+        resolver = VariableResolver(variables={"val": "replaced"})
+        data = OrderedDict(key="${val}", items=["${val}"])
+        result = resolver.resolve(data)
+        assert result == {"key": "replaced", "items": ["replaced"]}
+
+    def test_subclass_handler_override(self):
+        """Test that resolve() dispatches to handlers overridden in a subclass."""
+
+        class UpperResolver(VariableResolver):
+            def _resolve_string(self, s: str) -> str:
+                return super()._resolve_string(s).upper()
+
+        resolver = UpperResolver(variables={"val": "replaced"})
+        assert resolver.resolve({"key": ["${val}", "plain"]}) == {"key": ["REPLACED", "PLAIN"]}
+
 
 class TestMetadataParser:
     """Tests for MetadataParser."""
@@ -95,7 +119,7 @@ class TestMetadataParser:
             ]
         }
         file_path = temp_dir / "config.yaml"
-        file_path.write_text(yaml.dump(config))
+        file_path.write_text(yaml.dump(config, Dumper=_YAMLDumper))
 
         parser = MetadataParser(variables={"wh_id": "wh123", "cat": "c", "sch": "s"})
         configs = parser.parse(file_path)
@@ -110,6 +134,34 @@ class TestMetadataParser:
             parser.parse("/nonexistent/file.yaml")
         assert "not found" in str(exc_info.value)
 
+    def test_parse_string_json(self, sample_config_dict: dict):
+        """Test parsing JSON held in memory."""
+        configs = MetadataParser().parse_string(json.dumps(sample_config_dict), fmt="json")
+        assert len(configs) == 1
+        assert configs[0].space_id == "test_space"
+
+    @pytest.mark.parametrize(
+        "text,fmt,message",
+        [
+            ("spaces: [unclosed", "yaml", "Invalid YAML"),
+            ("{not json", "json", "Invalid JSON"),
+            ("spaces: []", "toml", "Unsupported config format"),
+        ],
+        ids=["bad_yaml", "bad_json", "unknown_format"],
+    )
+    def test_parse_string_errors(self, text: str, fmt, message: str):
+        """Test that in-memory parse failures raise ParserError."""
+        with pytest.raises(ParserError, match=message):
+            MetadataParser().parse_string(text, fmt=fmt)
+
+    def test_parse_string_env_config_from_base_path(self, temp_dir: Path):
+        """Test that base_path supplies environment variables like a file's directory."""
+        (temp_dir / "dev.yaml").write_text("variables:\n  wh_id: wh_from_env\n")
+        text = "space_id: s\ntitle: T\nwarehouse_id: ${wh_id}\n"
+
+        configs = MetadataParser().parse_string(text, base_path=temp_dir)
+        assert configs[0].warehouse_id == "wh_from_env"
+
     def test_parse_directory(self, temp_dir: Path, sample_config_dict: dict):
         """Test parsing a directory of configs."""
         # Create multiple files
@@ -117,13 +169,40 @@ class TestMetadataParser:
             config = sample_config_dict.copy()
             config["spaces"][0]["space_id"] = f"space_{i}"
             file_path = temp_dir / f"space_{i}.yaml"
-            file_path.write_text(yaml.dump(config))
+            file_path.write_text(yaml.dump(config, Dumper=_YAMLDumper))
 
         parser = MetadataParser()
         configs = parser.parse_directory(temp_dir)
         assert len(configs) == 3
 
-    def test_parse_instructions_with_new_format(self, temp_dir: Path):
+    def test_parse_directory_loads_env_config_once(self, temp_dir: Path, monkeypatch):
+        """Test that files sharing an env config read it once until it changes."""
+        spaces_dir = temp_dir / "spaces"
+        spaces_dir.mkdir()
+        for i in range(3):
+            config = {"space_id": f"space_{i}", "title": "Test", "warehouse_id": "${wh_id}"}
+            (spaces_dir / f"space_{i}.yaml").write_text(yaml.dump(config, Dumper=_YAMLDumper))
+        env_file = temp_dir / "environments" / "dev.yaml"
+        env_file.parent.mkdir()
+        env_file.write_text("variables:\n  wh_id: wh1\n")
+
+        parser = MetadataParser()
+        loaded: list[Path] = []
+        load_file = parser._load_file
+        monkeypatch.setattr(
+            parser, "_load_file", lambda path: loaded.append(path) or load_file(path)
+        )
+
+        configs = parser.parse_directory(spaces_dir)
+        assert [c.warehouse_id for c in configs] == ["wh1"] * 3
+        assert loaded.count(env_file) == 1
+
+        env_file.write_text("variables:\n  wh_id: wh_changed\n")
+        configs = parser.parse_directory(spaces_dir)
+        assert [c.warehouse_id for c in configs] == ["wh_changed"] * 3
+        assert loaded.count(env_file) == 2
+
+    def test_parse_instructions_with_new_format(self):
         """Test parsing instruction fields with new API format."""
         config = {
             "spaces": [
@@ -193,11 +272,8 @@ class TestMetadataParser:
                 }
             ]
         }
-        file_path = temp_dir / "config.yaml"
-        file_path.write_text(yaml.dump(config))
-
         parser = MetadataParser()
-        configs = parser.parse(file_path)
+        configs = parser.parse_string(yaml.dump(config, Dumper=_YAMLDumper))
 
         inst = configs[0].instructions
 
@@ -231,7 +307,7 @@ class TestMetadataParser:
         assert len(inst.sql_snippets.expressions) == 1
         assert len(inst.sql_snippets.measures) == 1
 
-    def test_parse_column_config_with_new_fields(self, temp_dir: Path):
+    def test_parse_column_config_with_new_fields(self):
         """Test parsing column configs with enable_format_assistance and enable_entity_matching."""
         config = {
             "spaces": [
@@ -258,11 +334,8 @@ class TestMetadataParser:
                 }
             ]
         }
-        file_path = temp_dir / "config.yaml"
-        file_path.write_text(yaml.dump(config))
-
         parser = MetadataParser()
-        configs = parser.parse(file_path)
+        configs = parser.parse_string(yaml.dump(config, Dumper=_YAMLDumper))
 
         col = configs[0].data_sources.tables[0].column_configs[0]
         assert col.column_name == "status"
@@ -270,7 +343,7 @@ class TestMetadataParser:
         assert col.enable_format_assistance is True
         assert col.enable_entity_matching is True
 
-    def test_parse_sample_questions_mixed_formats(self, temp_dir: Path):
+    def test_parse_sample_questions_mixed_formats(self):
         """Test parsing sample questions with mixed string and object formats."""
         config = {
             "spaces": [
@@ -286,11 +359,8 @@ class TestMetadataParser:
                 }
             ]
         }
-        file_path = temp_dir / "config.yaml"
-        file_path.write_text(yaml.dump(config))
-
         parser = MetadataParser()
-        configs = parser.parse(file_path)
+        configs = parser.parse_string(yaml.dump(config, Dumper=_YAMLDumper))
 
         sq = configs[0].sample_questions
         assert len(sq) == 2
@@ -300,7 +370,7 @@ class TestMetadataParser:
         assert sq[1].id == "sq1"
         assert sq[1].question == ["Complex question?"]
 
-    def test_parse_backward_compat_join_specs(self, temp_dir: Path):
+    def test_parse_backward_compat_join_specs(self):
         """Test parsing join specs with old format (backward compatibility)."""
         config = {
             "spaces": [
@@ -323,11 +393,8 @@ class TestMetadataParser:
                 }
             ]
         }
-        file_path = temp_dir / "config.yaml"
-        file_path.write_text(yaml.dump(config))
-
         parser = MetadataParser()
-        configs = parser.parse(file_path)
+        configs = parser.parse_string(yaml.dump(config, Dumper=_YAMLDumper))
 
         js = configs[0].instructions.join_specs[0]
         assert js.left.identifier == "c.s.left"
@@ -349,7 +416,7 @@ class TestValidateConfig:
         """Test validation catches missing required fields."""
         config = {"spaces": [{"title": "Test"}]}  # Missing space_id, warehouse_id
         file_path = temp_dir / "invalid.yaml"
-        file_path.write_text(yaml.dump(config))
+        file_path.write_text(yaml.dump(config, Dumper=_YAMLDumper))
 
         errors = validate_config(file_path)
         assert len(errors) > 0
@@ -375,86 +442,10 @@ class TestLoadConfig:
 class TestParameterDefaultValueFormats:
     """Tests for parsing parameter default_value in multiple formats."""
 
-    def test_api_format_with_values_array(self, temp_dir: Path):
-        """Test parsing default_value in API format: {values: [...]}."""
-        config = {
-            "spaces": [
-                {
-                    "space_id": "test",
-                    "title": "Test",
-                    "warehouse_id": "wh",
-                    "instructions": {
-                        "example_question_sqls": [
-                            {
-                                "id": "eq1",
-                                "question": ["Q?"],
-                                "sql": ["SELECT :param"],
-                                "parameters": [
-                                    {
-                                        "name": "param",
-                                        "type_hint": "STRING",
-                                        "default_value": {"values": ["default_value"]},
-                                    }
-                                ],
-                            }
-                        ]
-                    },
-                }
-            ]
-        }
-        file_path = temp_dir / "api_format.yaml"
-        file_path.write_text(yaml.dump(config))
-
-        parser = MetadataParser()
-        configs = parser.parse(file_path)
-
-        param = configs[0].instructions.example_question_sqls[0].parameters[0]
-        assert param.default_value is not None
-        assert param.default_value.values == ["default_value"]
-
-    def test_yaml_format_with_type_and_value(self, temp_dir: Path):
-        """Test parsing default_value in YAML format: {type: LITERAL, value: ...}."""
-        config = {
-            "spaces": [
-                {
-                    "space_id": "test",
-                    "title": "Test",
-                    "warehouse_id": "wh",
-                    "instructions": {
-                        "example_question_sqls": [
-                            {
-                                "id": "eq1",
-                                "question": ["Q?"],
-                                "sql": ["SELECT :param"],
-                                "parameters": [
-                                    {
-                                        "name": "param",
-                                        "type_hint": "STRING",
-                                        "default_value": {
-                                            "type": "LITERAL",
-                                            "value": "literal_value",
-                                        },
-                                    }
-                                ],
-                            }
-                        ]
-                    },
-                }
-            ]
-        }
-        file_path = temp_dir / "yaml_format.yaml"
-        file_path.write_text(yaml.dump(config))
-
-        parser = MetadataParser()
-        configs = parser.parse(file_path)
-
-        param = configs[0].instructions.example_question_sqls[0].parameters[0]
-        assert param.default_value is not None
-        assert param.default_value.values == ["literal_value"]
-
-    def test_direct_list_format(self, temp_dir: Path):
-        """Test parsing default_value as direct list."""
-        config = {
+    @staticmethod
+    def _config_with_parameter(parameter: dict) -> dict:
+        """Single-space config whose only example SQL takes ``parameter``."""
+        return {
             "spaces": [
                 {
                     "space_id": "test",
@@ -466,98 +457,39 @@ class TestParameterDefaultValueFormats:
                                 "id": "eq1",
                                 "question": ["Q?"],
                                 "sql": ["SELECT :param"],
-                                "parameters": [
-                                    {
-                                        "name": "param",
-                                        "type_hint": "STRING",
-                                        "default_value": ["list_value"],
-                                    }
-                                ],
+                                "parameters": [parameter],
                             }
                         ]
                     },
                 }
             ]
         }
-        file_path = temp_dir / "list_format.yaml"
-        file_path.write_text(yaml.dump(config))
 
-        parser = MetadataParser()
-        configs = parser.parse(file_path)
+    @pytest.mark.parametrize(
+        "default_value,expected",
+        [
+            ({"values": ["default_value"]}, ["default_value"]),
+            ({"type": "LITERAL", "value": "literal_value"}, ["literal_value"]),
+            (["list_value"], ["list_value"]),
+            ("string_value", ["string_value"]),
+        ],
+        ids=["api_values_array", "yaml_type_and_value", "direct_list", "direct_string"],
+    )
+    def test_default_value_format(self, default_value, expected):
+        """Each supported default_value format is normalized to a values list."""
+        config = self._config_with_parameter(
+            {"name": "param", "type_hint": "STRING", "default_value": default_value}
+        )
+        configs = MetadataParser().parse_string(yaml.dump(config, Dumper=_YAMLDumper))
 
         param = configs[0].instructions.example_question_sqls[0].parameters[0]
         assert param.default_value is not None
-        assert param.default_value.values == ["list_value"]
+        assert param.default_value.values == expected
 
-    def test_direct_string_format(self, temp_dir: Path):
-        """Test parsing default_value as direct string."""
-        config = {
-            "spaces": [
-                {
-                    "space_id": "test",
-                    "title": "Test",
-                    "warehouse_id": "wh",
-                    "instructions": {
-                        "example_question_sqls": [
-                            {
-                                "id": "eq1",
-                                "question": ["Q?"],
-                                "sql": ["SELECT :param"],
-                                "parameters": [
-                                    {
-                                        "name": "param",
-                                        "type_hint": "STRING",
-                                        "default_value": "string_value",
-                                    }
-                                ],
-                            }
-                        ]
-                    },
-                }
-            ]
-        }
-        file_path = temp_dir / "string_format.yaml"
-        file_path.write_text(yaml.dump(config))
-
-        parser = MetadataParser()
-        configs = parser.parse(file_path)
-
-        param = configs[0].instructions.example_question_sqls[0].parameters[0]
-        assert param.default_value is not None
-        assert param.default_value.values == ["string_value"]
-
-    def test_no_default_value(self, temp_dir: Path):
+    def test_no_default_value(self):
         """Test parsing parameter without default_value."""
-        config = {
-            "spaces": [
-                {
-                    "space_id": "test",
-                    "title": "Test",
-                    "warehouse_id": "wh",
-                    "instructions": {
-                        "example_question_sqls": [
-                            {
-                                "id": "eq1",
-                                "question": ["Q?"],
-                                "sql": ["SELECT :param"],
-                                "parameters": [
-                                    {
-                                        "name": "param",
-                                        "type_hint": "STRING",
-                                        # No default_value
-                                    }
-                                ],
-                            }
-                        ]
-                    },
-                }
-            ]
-        }
-        file_path = temp_dir / "no_default.yaml"
-        file_path.write_text(yaml.dump(config))
-
-        parser = MetadataParser()
-        configs = parser.parse(file_path)
+        config = self._config_with_parameter({"name": "param", "type_hint": "STRING"})
+        configs = MetadataParser().parse_string(yaml.dump(config, Dumper=_YAMLDumper))
 
         param = configs[0].instructions.example_question_sqls[0].parameters[0]
         assert param.default_value is None
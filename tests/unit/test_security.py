@@ -23,6 +23,17 @@ from genie_forge.models import (
 )
 from genie_forge.parsers import MetadataParser
 
+# Credential shapes that must never be persisted to disk
+SENSITIVE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"dapi[a-f0-9]{32}",  # Databricks PAT
+        r"Bearer\s+[a-zA-Z0-9_-]+",  # Bearer tokens
+        r"token\s*[:=]\s*['\"][^'\"]+['\"]",  # token: "value"
+        r"password\s*[:=]\s*['\"][^'\"]+['\"]",  # password: "value"
+    )
+]
+
 # =============================================================================
 # Credential Protection Tests
 # =============================================================================
@@ -78,16 +89,9 @@ class TestCredentialProtection:
 
         # Read state file and check for sensitive patterns
         content = state_file.read_text()
-        sensitive_patterns = [
-            r"dapi[a-f0-9]{32}",  # Databricks PAT
-            r"Bearer\s+[a-zA-Z0-9_-]+",  # Bearer tokens
-            r"token\s*[:=]\s*['\"][^'\"]+['\"]",  # token: "value"
-            r"password\s*[:=]\s*['\"][^'\"]+['\"]",  # password: "value"
-        ]
-
-        for pattern in sensitive_patterns:
-            assert not re.search(pattern, content, re.IGNORECASE), (
-                f"State file may contain sensitive data matching: {pattern}"
+        for pattern in SENSITIVE_PATTERNS:
+            assert not pattern.search(content), (
+                f"State file may contain sensitive data matching: {pattern.pattern}"
             )
 
     def test_config_file_warns_on_credentials(self, tmp_path):
@@ -134,6 +138,19 @@ spaces:
             if "Connecting with token" in msg:
                 assert "****" in msg, "Token should be replaced with masked version"
 
+    def test_log_filter_masks_args_and_keeps_plain_text(self):
+        """Test that string args are masked and text without keywords is untouched."""
+        from genie_forge import SensitiveDataFilter
+
+        token = "dapi" + "0123456789abcdef" * 2
+        record = logging.LogRecord(
+            "genie_forge.client", logging.INFO, __file__, 1, "Using %s for %s", (token, 3), None
+        )
+
+        assert SensitiveDataFilter().filter(record)
+        assert record.msg == "Using %s for %s"
+        assert record.args == ("dapi****", 3)
+
 
 # =============================================================================
 # SQL Injection Tests